@@ -0,0 +1,66 @@
+# Compile the .env file into an importable Python module
+#
+# Usage (from the newsfilter_scraper directory):
+#     python -m config.compile_env [path/to/.env]
+
+import sys
+from pathlib import Path
+from typing import Optional
+
+try:
+    from dotenv import dotenv_values
+except ImportError:
+    print("python-dotenv is required. Install with: pip install python-dotenv")
+    sys.exit(1)
+
+COMPILED_ENV_FILE = Path(__file__).parent / "_env_compiled.py"
+
+
+def compile_env(env_file: Path, output_file: Path = COMPILED_ENV_FILE) -> Path:
+    """
+    Write the values of an .env file to a Python module
+
+    Args:
+        env_file: Path to the .env file to compile
+        output_file: Path of the generated module
+
+    Returns:
+        Path: The generated module path
+    """
+    values = {
+        key: value
+        for key, value in dotenv_values(env_file).items()
+        if value is not None
+    }
+
+    lines = [
+        "# Generated by config/compile_env.py - do not edit or commit",
+        "",
+        f"SOURCE_FILE = {str(env_file.resolve())!r}",
+        f"SOURCE_MTIME_NS = {env_file.stat().st_mtime_ns}",
+        "",
+        "ENV = {",
+    ]
+    lines.extend(f"    {key!r}: {value!r}," for key, value in sorted(values.items()))
+    lines.append("}")
+
+    output_file.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    return output_file
+
+
+def main(argv: Optional[list] = None) -> int:
+    """Command line entry point"""
+    argv = sys.argv[1:] if argv is None else argv
+    env_file = Path(argv[0]) if argv else Path(__file__).parent.parent / ".env"
+
+    if not env_file.exists():
+        print(f"No .env file found at: {env_file}")
+        return 1
+
+    output_file = compile_env(env_file)
+    print(f"Compiled {env_file} to {output_file}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,10 +1,42 @@
 # Logging configuration setup
 
+import atexit
 import os
 import logging
-import logging.handlers
+import queue
+from contextvars import ContextVar
+from functools import cached_property
+from logging.handlers import QueueListener, RotatingFileHandler
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, Optional
+
+DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+# Records queued by the "file" handler and written by a background listener
+LOG_QUEUE: "queue.Queue[logging.LogRecord]" = queue.Queue(-1)
+_queue_listener: Optional[QueueListener] = None
+
+# Message prefix for the current thread/task, e.g. "[fetch] "; set by
+# utils.logger.ContextLogger and stamped on records by ContextFilter
+LOG_CONTEXT: ContextVar[str] = ContextVar("log_context", default="")
+
+
+def _stop_queue_listener():
+    """Flush queued records and close the current listener's file handler"""
+    if _queue_listener is None:
+        return
+
+    _queue_listener.stop()
+    for handler in _queue_listener.handlers:
+        handler.close()
+
+
+class ContextFilter(logging.Filter):
+    """Adds the current LOG_CONTEXT prefix to records as %(context)s"""
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        record.context = LOG_CONTEXT.get()
+        return True
 
 
 class LoggingConfig:
@@ -22,9 +54,59 @@ class LoggingConfig:
         )  # Convert MB to bytes
         self.backup_count = int(os.getenv("LOG_BACKUP_COUNT", "5"))
         self.console_output = os.getenv("CONSOLE_LOGGING", "true").lower() == "true"
+        self.fast_logging = os.getenv("FAST_LOGGING", "false").lower() == "true"
 
-        # Create the main logger configuration
-        self.logger_config = self._create_logger_config()
+        if self.fast_logging:
+            # Skip collecting thread/process info and the stack walk that
+            # resolves %(lineno)d on every log record
+            logging.logThreads = False
+            logging.logProcesses = False
+            logging.logMultiprocessing = False
+            logging._srcfile = None
+            self.detailed_format = (
+                "[%(asctime)s] %(levelname)s [%(name)s] %(context)s%(message)s"
+            )
+        else:
+            self.detailed_format = (
+                "[%(asctime)s] %(levelname)s [%(name)s:%(lineno)d] "
+                "%(context)s%(message)s"
+            )
+
+    def start_queue_listener(self):
+        """
+        Start the background thread that writes queued records to the log file
+
+        Called once the configuration has been applied. A listener started by
+        an earlier configuration is stopped first, so the current log file,
+        size limits and level always take effect.
+        """
+        global _queue_listener
+
+        if _queue_listener is None:
+            atexit.register(_stop_queue_listener)
+        else:
+            _stop_queue_listener()
+
+        file_handler = RotatingFileHandler(
+            self.log_file,
+            maxBytes=self.max_log_size,
+            backupCount=self.backup_count,
+            encoding="utf-8",
+        )
+        file_handler.setFormatter(
+            logging.Formatter(self.detailed_format, datefmt=DATE_FORMAT)
+        )
+        file_handler.setLevel(self.log_level)
+
+        _queue_listener = QueueListener(
+            LOG_QUEUE, file_handler, respect_handler_level=True
+        )
+        _queue_listener.start()
+
+    @cached_property
+    def logger_config(self) -> Dict[str, Any]:
+        """The logging configuration dictionary, built on first access"""
+        return self._create_logger_config()
 
     def _create_logger_config(self) -> Dict[str, Any]:
         """Create the logging configuration dictionary"""
@@ -32,23 +114,25 @@ class LoggingConfig:
         # Define formatters
         formatters = {
             "detailed": {
-                "format": "[%(asctime)s] %(levelname)s [%(name)s:%(lineno)d] %(message)s",
-                "datefmt": "%Y-%m-%d %H:%M:%S",
+                "format": self.detailed_format,
+                "datefmt": DATE_FORMAT,
             },
             "simple": {"format": "%(levelname)s: %(message)s"},
             "stats": {"format": "%(message)s"},
         }
 
+        # Context is captured on the logging thread, before records are queued
+        filters = {"context": {"()": ContextFilter}}
+
         # Define handlers
         handlers = {
+            # Hands records to the queue listener so file I/O stays off the
+            # calling thread
             "file": {
-                "class": "logging.handlers.RotatingFileHandler",
-                "filename": self.log_file,
-                "maxBytes": self.max_log_size,
-                "backupCount": self.backup_count,
-                "formatter": "detailed",
+                "class": "logging.handlers.QueueHandler",
+                "queue": "ext://config.logging_config.LOG_QUEUE",
                 "level": self.log_level,
-                "encoding": "utf-8",
+                "filters": ["context"],
             }
         }
 
@@ -58,29 +142,32 @@ class LoggingConfig:
                 "class": "logging.StreamHandler",
                 "formatter": "detailed",
                 "level": self.log_level,
+                "filters": ["context"],
                 "stream": "ext://sys.stdout",
             }
 
+        handler_names = list(handlers)
+
         # Define loggers
         loggers = {
             # Root logger configuration
-            "": {"level": self.log_level, "handlers": list(handlers.keys())},
+            "": {"level": self.log_level, "handlers": handler_names},
             # Specific logger for statistics (always goes to file)
             "stats": {"level": "INFO", "handlers": ["file"], "propagate": False},
             # Reduce verbosity for external libraries
             "urllib3": {
                 "level": "WARNING",
-                "handlers": list(handlers.keys()),
+                "handlers": handler_names,
                 "propagate": False,
             },
             "requests": {
                 "level": "WARNING",
-                "handlers": list(handlers.keys()),
+                "handlers": handler_names,
                 "propagate": False,
             },
             "sqlalchemy.engine": {
                 "level": "WARNING",
-                "handlers": list(handlers.keys()),
+                "handlers": handler_names,
                 "propagate": False,
             },
         }
@@ -89,6 +176,7 @@ class LoggingConfig:
             "version": 1,
             "disable_existing_loggers": False,
             "formatters": formatters,
+            "filters": filters,
             "handlers": handlers,
             "loggers": loggers,
         }
@@ -1,30 +1,41 @@
 # Configuration management - loads .env and provides app settings
 
+import importlib.util
+import logging
 import os
 import sys
 from pathlib import Path
-from typing import Optional, List, Dict, Any
+from types import MappingProxyType
+from typing import Optional, List, Dict, Any, Mapping, Union
+from urllib.parse import urlsplit, urlunsplit
 from dataclasses import dataclass
 
-try:
-    from dotenv import load_dotenv
-except ImportError:
+# python-dotenv is imported on first use; only check that it is installed here
+if importlib.util.find_spec("dotenv") is None:
     print("python-dotenv is required. Install with: pip install python-dotenv")
     sys.exit(1)
 
+# Accepted prefixes and values used by Settings._validate_config
+_VALID_DB_PREFIXES = ("mysql+pymysql://", "mysql://", "sqlite:///")
+_VALID_HTTP_PREFIXES = ("http://", "https://")
+_VALID_LOG_LEVELS = frozenset({"DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"})
 
-@dataclass
+# ENVIRONMENT values treated as development mode
+_DEVELOPMENT_ENVIRONMENTS = frozenset({"development", "dev", "debug"})
+
+
+@dataclass(frozen=True)
 class DatabaseConfig:
     """Database configuration settings"""
 
     url: str
-    pool_size: int = 5
-    max_overflow: int = 10
+    pool_size: int = 20
+    max_overflow: int = 30
     pool_timeout: int = 30
     pool_recycle: int = 3600
 
 
-@dataclass
+@dataclass(frozen=True)
 class APIConfig:
     """API configuration settings"""
 
@@ -35,16 +46,16 @@ class APIConfig:
     retry_backoff: float = 1.0
 
 
-@dataclass
+@dataclass(frozen=True)
 class RateLimitConfig:
     """Rate limiting configuration"""
 
     max_daily_requests: int = 100
-    tracking_file: str = "data/rate_limit.json"
+    tracking_file: str = "data/rate_limit.bin"
     reset_hour: int = 0  # Hour of day when limit resets (0-23)
 
 
-@dataclass
+@dataclass(frozen=True)
 class LoggingConfig:
     """Logging configuration settings"""
 
@@ -54,29 +65,80 @@ class LoggingConfig:
     backup_count: int = 5
     console_output: bool = True
     structured_format: bool = False
+    fast_logging: bool = False
+
+
+def _parse_bool(value: str) -> bool:
+    """Parse a "true"/"false" environment value"""
+    return value.lower() == "true"
+
+
+# Configuration sections and the environment variables that populate them:
+# (env var, cast, default, section, attribute). A default of None marks the
+# variable as required.
+_CONFIG_SECTIONS = {
+    "database": DatabaseConfig,
+    "api": APIConfig,
+    "rate_limit": RateLimitConfig,
+    "logging": LoggingConfig,
+}
+
+_CONFIG_FIELDS = (
+    ("DATABASE_URL", str, None, "database", "url"),
+    ("DB_POOL_SIZE", int, "20", "database", "pool_size"),
+    ("DB_MAX_OVERFLOW", int, "30", "database", "max_overflow"),
+    ("DB_POOL_TIMEOUT", int, "30", "database", "pool_timeout"),
+    ("DB_POOL_RECYCLE", int, "3600", "database", "pool_recycle"),
+    ("NEWSFILTER_API_KEY", str, None, "api", "key"),
+    ("NEWSFILTER_API_URL", str, "https://api.newsfilter.io", "api", "base_url"),
+    ("API_TIMEOUT", int, "30", "api", "timeout"),
+    ("API_RETRY_ATTEMPTS", int, "3", "api", "retry_attempts"),
+    ("API_RETRY_BACKOFF", float, "1.0", "api", "retry_backoff"),
+    ("MAX_DAILY_REQUESTS", int, "100", "rate_limit", "max_daily_requests"),
+    ("RATE_LIMIT_FILE", str, "data/rate_limit.bin", "rate_limit", "tracking_file"),
+    ("RATE_LIMIT_RESET_HOUR", int, "0", "rate_limit", "reset_hour"),
+    ("LOG_LEVEL", str.upper, "INFO", "logging", "level"),
+    ("LOG_FILE", str, "logs/scraper.log", "logging", "file"),
+    ("MAX_LOG_SIZE_MB", int, "10", "logging", "max_size_mb"),
+    ("LOG_BACKUP_COUNT", int, "5", "logging", "backup_count"),
+    ("CONSOLE_LOGGING", _parse_bool, "true", "logging", "console_output"),
+    ("STRUCTURED_LOGGING", _parse_bool, "false", "logging", "structured_format"),
+    ("FAST_LOGGING", _parse_bool, "false", "logging", "fast_logging"),
+)
 
 
 class Settings:
     """Main configuration class that loads and validates all settings"""
 
-    def __init__(self, env_file: Optional[str] = None):
+    def __init__(
+        self, env_file: Optional[Union[str, Path]] = None, quiet: bool = False
+    ):
         """
         Initialize settings by loading from environment
 
         Args:
             env_file: Optional path to .env file (defaults to .env in project root)
+            quiet: Suppress informational startup messages
         """
+        self.quiet = quiet
+        self.logger = logging.getLogger(__name__)
         self.project_root = Path(__file__).parent.parent
-        self.env_file = env_file or self.project_root / ".env"
+        self.env_file = Path(env_file) if env_file else self.project_root / ".env"
 
         # Load environment variables
         self._load_environment()
+        self._is_development = (
+            self._env_get("ENVIRONMENT", "production").lower()
+            in _DEVELOPMENT_ENVIRONMENTS
+        )
 
         # Initialize configuration sections
-        self.database = self._load_database_config()
-        self.api = self._load_api_config()
-        self.rate_limit = self._load_rate_limit_config()
-        self.logging = self._load_logging_config()
+        sections = self._load_config_sections()
+        self.database: DatabaseConfig = sections["database"]
+        self.api: APIConfig = sections["api"]
+        self.rate_limit: RateLimitConfig = sections["rate_limit"]
+        self.logging: LoggingConfig = sections["logging"]
+        self._masked_db_url = self._mask_credentials(self.database.url)
 
         # Initialize additional settings
         self.process_lock_file = self._get_env_path(
@@ -94,66 +156,95 @@ class Settings:
         # Expose commonly used settings at top level for backward compatibility
         self._setup_legacy_attributes()
 
+        # Settings are immutable once loaded, so build the client kwargs once
+        self._db_engine_kwargs = MappingProxyType(
+            {
+                "pool_size": self.database.pool_size,
+                "max_overflow": self.database.max_overflow,
+                "pool_timeout": self.database.pool_timeout,
+                "pool_recycle": self.database.pool_recycle,
+                "echo": self.logging.level == "DEBUG",
+            }
+        )
+        self._api_client_kwargs = MappingProxyType(
+            {
+                "timeout": self.api.timeout,
+                "retry_attempts": self.api.retry_attempts,
+                "retry_backoff": self.api.retry_backoff,
+            }
+        )
+
     def _load_environment(self):
         """Load environment variables from .env file if it exists"""
         if self.env_file.exists():
-            load_dotenv(self.env_file)
-            print(f"Loaded environment from: {self.env_file}")
+            if self._load_environment_compiled():
+                self._log_info("Loaded compiled environment for: %s", self.env_file)
+            else:
+                from dotenv import load_dotenv
+
+                load_dotenv(self.env_file)
+                self._log_info("Loaded environment from: %s", self.env_file)
         else:
-            print(f"No .env file found at: {self.env_file}")
-            print("Using environment variables and defaults")
-
-    def _load_database_config(self) -> DatabaseConfig:
-        """Load database configuration"""
-        database_url = os.getenv("DATABASE_URL")
-        if not database_url:
-            raise ValueError("DATABASE_URL environment variable is required")
-
-        return DatabaseConfig(
-            url=database_url,
-            pool_size=int(os.getenv("DB_POOL_SIZE", "5")),
-            max_overflow=int(os.getenv("DB_MAX_OVERFLOW", "10")),
-            pool_timeout=int(os.getenv("DB_POOL_TIMEOUT", "30")),
-            pool_recycle=int(os.getenv("DB_POOL_RECYCLE", "3600")),
-        )
+            self._log_info("No .env file found at: %s", self.env_file)
+            self._log_info("Using environment variables and defaults")
 
-    def _load_api_config(self) -> APIConfig:
-        """Load API configuration"""
-        api_key = os.getenv("NEWSFILTER_API_KEY")
-        if not api_key:
-            raise ValueError("NEWSFILTER_API_KEY environment variable is required")
-
-        return APIConfig(
-            key=api_key,
-            base_url=os.getenv("NEWSFILTER_API_URL", "https://api.newsfilter.io"),
-            timeout=int(os.getenv("API_TIMEOUT", "30")),
-            retry_attempts=int(os.getenv("API_RETRY_ATTEMPTS", "3")),
-            retry_backoff=float(os.getenv("API_RETRY_BACKOFF", "1.0")),
-        )
+        # Snapshot the environment once so settings resolve from a plain dict
+        self._env = dict(os.environ)
 
-    def _load_rate_limit_config(self) -> RateLimitConfig:
-        """Load rate limiting configuration"""
-        return RateLimitConfig(
-            max_daily_requests=int(os.getenv("MAX_DAILY_REQUESTS", "100")),
-            tracking_file=os.getenv("RATE_LIMIT_FILE", "data/rate_limit.json"),
-            reset_hour=int(os.getenv("RATE_LIMIT_RESET_HOUR", "0")),
-        )
+    def _log_info(self, msg: str, *args):
+        """Log an informational message unless running quietly"""
+        if not self.quiet:
+            self.logger.info(msg, *args)
 
-    def _load_logging_config(self) -> LoggingConfig:
-        """Load logging configuration"""
-        return LoggingConfig(
-            level=os.getenv("LOG_LEVEL", "INFO").upper(),
-            file=os.getenv("LOG_FILE", "logs/scraper.log"),
-            max_size_mb=int(os.getenv("MAX_LOG_SIZE_MB", "10")),
-            backup_count=int(os.getenv("LOG_BACKUP_COUNT", "5")),
-            console_output=os.getenv("CONSOLE_LOGGING", "true").lower() == "true",
-            structured_format=os.getenv("STRUCTURED_LOGGING", "false").lower()
-            == "true",
-        )
+    def _load_environment_compiled(self) -> bool:
+        """
+        Load environment variables from the module generated by
+        `python -m config.compile_env`, if it is present and up to date
+
+        Returns:
+            bool: True if the compiled environment was used
+        """
+        try:
+            from config import _env_compiled
+        except ImportError:
+            return False
+
+        if (
+            _env_compiled.SOURCE_FILE != str(self.env_file.resolve())
+            or _env_compiled.SOURCE_MTIME_NS != self.env_file.stat().st_mtime_ns
+        ):
+            # Stale or generated for another file - fall back to parsing .env
+            return False
+
+        for key, value in _env_compiled.ENV.items():
+            os.environ.setdefault(key, value)
+
+        return True
+
+    def _env_get(self, key: str, default: Optional[str] = None) -> Optional[str]:
+        """Get a value from the environment snapshot"""
+        return self._env.get(key, default)
+
+    def _load_config_sections(self) -> Dict[str, Any]:
+        """Load every configuration section described by _CONFIG_FIELDS"""
+        values: Dict[str, Dict[str, Any]] = {
+            section: {} for section in _CONFIG_SECTIONS
+        }
+
+        for env_var, cast, default, section, attr in _CONFIG_FIELDS:
+            raw = self._env_get(env_var, default)
+            if not raw and default is None:
+                raise ValueError(f"{env_var} environment variable is required")
+            values[section][attr] = cast(raw)
+
+        return {
+            section: config_class(**values[section])
+            for section, config_class in _CONFIG_SECTIONS.items()
+        }
 
     def _get_env_path(self, env_var: str, default: str) -> Path:
         """Get path from environment variable with default"""
-        path_str = os.getenv(env_var, default)
+        path_str = self._env_get(env_var, default)
         path = Path(path_str)
 
         # Make relative paths relative to project root
@@ -174,22 +265,20 @@ class Settings:
         for directory in directories:
             if directory and not directory.exists():
                 directory.mkdir(parents=True, exist_ok=True)
-                print(f"Created directory: {directory}")
+                self._log_info("Created directory: %s", directory)
 
     def _validate_config(self):
         """Validate the loaded configuration"""
         errors = []
 
         # Validate database URL format
-        if not self.database.url.startswith(
-            ("mysql+pymysql://", "mysql://", "sqlite:///")
-        ):
+        if not self.database.url.startswith(_VALID_DB_PREFIXES):
             errors.append(
                 "DATABASE_URL must start with mysql+pymysql://, mysql://, or sqlite:///"
             )
 
         # Validate API URL format
-        if not self.api.base_url.startswith(("http://", "https://")):
+        if not self.api.base_url.startswith(_VALID_HTTP_PREFIXES):
             errors.append("NEWSFILTER_API_URL must start with http:// or https://")
 
         # Validate numeric ranges
@@ -206,26 +295,17 @@ class Settings:
             errors.append("LOG_BACKUP_COUNT must be between 1 and 50")
 
         # Validate log level
-        valid_log_levels = ["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]
-        if self.logging.level not in valid_log_levels:
-            errors.append(f"LOG_LEVEL must be one of: {', '.join(valid_log_levels)}")
+        if self.logging.level not in _VALID_LOG_LEVELS:
+            errors.append(
+                f"LOG_LEVEL must be one of: {', '.join(sorted(_VALID_LOG_LEVELS))}"
+            )
 
         # Validate file permissions
-        try:
-            # Check if we can write to the data directory
-            test_file = self.data_directory / "test_write.tmp"
-            test_file.touch()
-            test_file.unlink()
-        except Exception as e:
-            errors.append(f"Cannot write to data directory {self.data_directory}: {e}")
+        if not os.access(self.data_directory, os.W_OK):
+            errors.append(f"Cannot write to data directory {self.data_directory}")
 
-        try:
-            # Check if we can write to the logs directory
-            test_file = self.logs_directory / "test_write.tmp"
-            test_file.touch()
-            test_file.unlink()
-        except Exception as e:
-            errors.append(f"Cannot write to logs directory {self.logs_directory}: {e}")
+        if not os.access(self.logs_directory, os.W_OK):
+            errors.append(f"Cannot write to logs directory {self.logs_directory}")
 
         if errors:
             raise ValueError(
@@ -250,35 +330,21 @@ class Settings:
         self.LOG_LEVEL = self.logging.level
         self.LOG_FILE = self.logging.file
 
-    def get_database_engine_kwargs(self) -> Dict[str, Any]:
-        """Get SQLAlchemy engine configuration"""
-        return {
-            "pool_size": self.database.pool_size,
-            "max_overflow": self.database.max_overflow,
-            "pool_timeout": self.database.pool_timeout,
-            "pool_recycle": self.database.pool_recycle,
-            "echo": self.logging.level == "DEBUG",
-        }
+    def get_database_engine_kwargs(self) -> Mapping[str, Any]:
+        """Get SQLAlchemy engine configuration (read-only)"""
+        return self._db_engine_kwargs
 
-    def get_api_client_kwargs(self) -> Dict[str, Any]:
-        """Get API client configuration"""
-        return {
-            "timeout": self.api.timeout,
-            "retry_attempts": self.api.retry_attempts,
-            "retry_backoff": self.api.retry_backoff,
-        }
+    def get_api_client_kwargs(self) -> Mapping[str, Any]:
+        """Get API client configuration (read-only)"""
+        return self._api_client_kwargs
 
     def is_development(self) -> bool:
         """Check if running in development mode"""
-        return os.getenv("ENVIRONMENT", "production").lower() in [
-            "development",
-            "dev",
-            "debug",
-        ]
+        return self._is_development
 
     def is_production(self) -> bool:
         """Check if running in production mode"""
-        return not self.is_development()
+        return not self._is_development
 
     def print_config_summary(self):
         """Print a summary of the current configuration (without sensitive data)"""
@@ -290,7 +356,7 @@ class Settings:
         print(f"Config File: {self.env_file}")
 
         print("\nDatabase:")
-        print(f"  URL: {self._mask_credentials(self.database.url)}")
+        print(f"  URL: {self._masked_db_url}")
         print(f"  Pool Size: {self.database.pool_size}")
         print(f"  Max Overflow: {self.database.max_overflow}")
 
@@ -317,24 +383,33 @@ class Settings:
 
     def _mask_credentials(self, url: str) -> str:
         """Mask credentials in database URL for logging"""
-        if "://" in url and "@" in url:
-            protocol, rest = url.split("://", 1)
-            if "@" in rest:
-                credentials, host_part = rest.split("@", 1)
-                return f"{protocol}://***:***@{host_part}"
-        return url
+        parsed = urlsplit(url)
+        if "@" not in parsed.netloc:
+            return url
+
+        host_part = parsed.netloc.rpartition("@")[2]
+        return urlunsplit(
+            (
+                parsed.scheme,
+                f"***:***@{host_part}",
+                parsed.path,
+                parsed.query,
+                parsed.fragment,
+            )
+        )
 
 
 # Global settings instance
 _settings_instance: Optional[Settings] = None
 
 
-def get_settings(reload: bool = False) -> Settings:
+def get_settings(reload: bool = False, quiet: bool = False) -> Settings:
     """
     Get the global settings instance (singleton pattern)
 
     Args:
         reload: Whether to reload settings from environment
+        quiet: Suppress informational startup messages when loading
 
     Returns:
         Settings: The settings instance
@@ -342,6 +417,6 @@ def get_settings(reload: bool = False) -> Settings:
     global _settings_instance
 
     if _settings_instance is None or reload:
-        _settings_instance = Settings()
+        _settings_instance = Settings(quiet=quiet)
 
     return _settings_instance
@@ -1,11 +1,18 @@
 # HTTP API client with authentication for newsfilter.io
 
-import time
-import requests
-from typing import List, Dict, Any, Optional
-from datetime import datetime
+import asyncio
+import ijson
+import orjson
+from typing import TYPE_CHECKING, Iterator, List, Dict, Any, Optional, Tuple
 import logging
 
+if TYPE_CHECKING:
+    from datetime import datetime
+
+    import requests
+
+    from core.rate_limiter import RateLimiter
+
 
 class NewsfilterAPIError(Exception):
     """Custom exception for API-related errors"""
@@ -14,7 +21,11 @@ class NewsfilterAPIError(Exception):
 
 
 class NewsfilterAPIClient:
-    """Client for interacting with the newsfilter.io API"""
+    """Client for interacting with the newsfilter.io API
+
+    All synchronous calls go through one pooled ``requests.Session``, so
+    consecutive requests to the API reuse a kept-alive connection.
+    """
 
     def __init__(
         self,
@@ -40,10 +51,30 @@ class NewsfilterAPIClient:
         self.retry_attempts = retry_attempts
         self.retry_backoff = retry_backoff
 
+        # Imported here so that importing this module stays cheap
+        import requests
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+
         self.logger = logging.getLogger(__name__)
+        self._debug_enabled = self.logger.isEnabledFor(logging.DEBUG)
+
+        # Retry timeouts, connection errors, 429 and 5xx responses with
+        # exponential backoff, honouring Retry-After
+        retry = Retry(
+            total=retry_attempts,
+            backoff_factor=retry_backoff,
+            status_forcelist=(429, 500, 502, 503, 504),
+            allowed_methods=frozenset(["GET", "POST"]),
+            respect_retry_after_header=True,
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(max_retries=retry, pool_connections=10, pool_maxsize=20)
 
         # Session for connection pooling
         self.session = requests.Session()
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
         self.session.headers.update(
             {
                 "User-Agent": "NewsfilterScraper/1.0",
@@ -85,7 +116,7 @@ class NewsfilterAPIClient:
         offset: int = 0,
         symbol: Optional[str] = None,
         source: Optional[str] = None,
-        since: Optional[datetime] = None,
+        since: Optional["datetime"] = None,
     ) -> List[Dict[str, Any]]:
         """
         Fetch articles from the API
@@ -100,10 +131,40 @@ class NewsfilterAPIClient:
         Returns:
             List[Dict]: List of article data
         """
+        return list(
+            self.iter_articles(
+                limit=limit, offset=offset, symbol=symbol, source=source, since=since
+            )
+        )
+
+    def iter_articles(
+        self,
+        limit: int = 100,
+        offset: int = 0,
+        symbol: Optional[str] = None,
+        source: Optional[str] = None,
+        since: Optional["datetime"] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Stream articles from the API, parsing them as they arrive
+
+        Args:
+            limit: Maximum number of articles to fetch
+            offset: Offset for pagination
+            symbol: Filter by ticker symbol (optional)
+            source: Filter by source (optional)
+            since: Only get articles since this datetime (optional)
+
+        Yields:
+            Dict: Article data
+        """
         if not self._authenticated:
             if not self.authenticate():
                 raise NewsfilterAPIError("Authentication required")
 
+        import requests
+        import urllib3
+
         # Build query parameters
         params = {"limit": limit, "offset": offset}
 
@@ -116,31 +177,144 @@ class NewsfilterAPIClient:
 
         try:
             response = self._make_request(
-                "GET", "/articles", params=params, authenticate=True
+                "GET", "/articles", params=params, authenticate=True, stream=True
             )
 
             if response and response.status_code == 200:
-                data = response.json()
-                articles = data.get("articles", [])
-
-                self.logger.info(
-                    f"Successfully fetched {len(articles)} articles from API"
-                )
-                return articles
+                count = 0
+                try:
+                    # Let urllib3 undo any gzip/deflate encoding while streaming
+                    response.raw.decode_content = True
+                    for article in ijson.items(
+                        response.raw, "articles.item", use_float=True
+                    ):
+                        count += 1
+                        yield article
+                finally:
+                    response.close()
+
+                self.logger.info(f"Successfully fetched {count} articles from API")
             else:
                 error_msg = f"Failed to fetch articles: {response.status_code if response else 'No response'}"
                 if response:
                     try:
-                        error_data = response.json()
+                        error_data = orjson.loads(response.content)
                         error_msg += f" - {error_data.get('message', 'Unknown error')}"
                     except:
                         error_msg += f" - {response.text}"
 
                 raise NewsfilterAPIError(error_msg)
 
-        except requests.exceptions.RequestException as e:
+        # Reading response.raw directly surfaces mid-body failures as urllib3
+        # errors rather than requests exceptions
+        except (
+            requests.exceptions.RequestException,
+            urllib3.exceptions.HTTPError,
+        ) as e:
             raise NewsfilterAPIError(f"Network error while fetching articles: {str(e)}")
 
+        except ijson.JSONError as e:
+            raise NewsfilterAPIError(f"Invalid articles response: {str(e)}")
+
+    async def get_articles_batch(
+        self,
+        pages: List[Tuple[int, int]],
+        rate_limiter: Optional["RateLimiter"] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Fetch several pages of articles concurrently over one HTTP/2 connection
+
+        Requires the optional httpx[http2] dependency.
+
+        Args:
+            pages: List of (limit, offset) pairs to fetch
+            rate_limiter: Limiter that must allow, and records, every page
+
+        Returns:
+            List[Dict]: Articles from all pages, in page order
+        """
+        try:
+            import httpx
+        except ImportError:
+            raise NewsfilterAPIError(
+                "httpx is required for batch fetching. "
+                "Install with: pip install 'httpx[http2]'"
+            )
+
+        # authenticate() and the limiter's file lock block, so keep them off
+        # the event loop
+        loop = asyncio.get_running_loop()
+        if not self._authenticated:
+            if not await loop.run_in_executor(None, self.authenticate):
+                raise NewsfilterAPIError("Authentication required")
+
+        if rate_limiter is not None:
+            if rate_limiter.simulate_requests(len(pages))["would_exceed_limit"]:
+                raise NewsfilterAPIError(
+                    f"Fetching {len(pages)} pages would exceed the API rate limit"
+                )
+            for _ in pages:
+                await loop.run_in_executor(None, rate_limiter.record_request)
+
+        # Only end-to-end headers: the session's defaults may carry
+        # connection-specific ones that HTTP/2 forbids
+        headers = {
+            "User-Agent": self.session.headers["User-Agent"],
+            "Accept": "application/json",
+            "Authorization": f"Bearer {self.api_key}",
+        }
+
+        try:
+            async with httpx.AsyncClient(
+                base_url=self.base_url,
+                http2=True,
+                timeout=self.timeout,
+                headers=headers,
+                transport=httpx.AsyncHTTPTransport(
+                    http2=True, retries=self.retry_attempts
+                ),
+            ) as client:
+                responses = await asyncio.gather(
+                    *[
+                        client.get(
+                            "/articles", params={"limit": limit, "offset": offset}
+                        )
+                        for limit, offset in pages
+                    ]
+                )
+        except httpx.HTTPError as e:
+            raise NewsfilterAPIError(f"Network error while fetching articles: {str(e)}")
+
+        articles = []
+        for response in responses:
+            if response.status_code != 200:
+                raise NewsfilterAPIError(
+                    f"Failed to fetch articles: {response.status_code}"
+                )
+            articles.extend(orjson.loads(response.content).get("articles", []))
+
+        self.logger.info(
+            f"Successfully fetched {len(articles)} articles from {len(pages)} pages"
+        )
+        return articles
+
+    def get_articles_pages(
+        self,
+        pages: List[Tuple[int, int]],
+        rate_limiter: Optional["RateLimiter"] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Synchronous wrapper around get_articles_batch
+
+        Args:
+            pages: List of (limit, offset) pairs to fetch
+            rate_limiter: Limiter that must allow, and records, every page
+
+        Returns:
+            List[Dict]: Articles from all pages, in page order
+        """
+        return asyncio.run(self.get_articles_batch(pages, rate_limiter))
+
     def _make_request(
         self,
         method: str,
@@ -148,7 +322,8 @@ class NewsfilterAPIClient:
         params: Optional[Dict] = None,
         data: Optional[Dict] = None,
         authenticate: bool = False,
-    ) -> Optional[requests.Response]:
+        stream: bool = False,
+    ) -> Optional["requests.Response"]:
         """
         Make an HTTP request with retry logic
 
@@ -158,10 +333,13 @@ class NewsfilterAPIClient:
             params: Query parameters
             data: Request body data
             authenticate: Whether to include authentication
+            stream: Whether to defer downloading the response body
 
         Returns:
             requests.Response: The response object
         """
+        import requests
+
         url = f"{self.base_url}{endpoint}"
 
         # Add authentication if required
@@ -169,73 +347,35 @@ class NewsfilterAPIClient:
         if authenticate:
             headers["Authorization"] = f"Bearer {self.api_key}"
 
-        for attempt in range(self.retry_attempts + 1):
-            try:
-                self.logger.debug(
-                    f"Making {method} request to {url} (attempt {attempt + 1})"
-                )
+        if self._debug_enabled:
+            self.logger.debug("Making %s request to %s", method, url)
 
-                response = self.session.request(
-                    method=method,
-                    url=url,
-                    params=params,
-                    json=data,
-                    headers=headers,
-                    timeout=self.timeout,
-                )
+        # Retries, backoff and Retry-After handling are done by the session's
+        # urllib3 adapter (see __init__)
+        try:
+            return self.session.request(
+                method=method,
+                url=url,
+                params=params,
+                json=data,
+                headers=headers,
+                timeout=self.timeout,
+                stream=stream,
+            )
 
-                # Handle rate limiting
-                if response.status_code == 429:
-                    retry_after = int(response.headers.get("Retry-After", 60))
-                    self.logger.warning(
-                        f"Rate limited. Waiting {retry_after} seconds..."
-                    )
-                    time.sleep(retry_after)
-                    continue
-
-                # Handle server errors with retry
-                if response.status_code >= 500:
-                    if attempt < self.retry_attempts:
-                        wait_time = self.retry_backoff * (2**attempt)
-                        self.logger.warning(
-                            f"Server error {response.status_code}. Retrying in {wait_time} seconds..."
-                        )
-                        time.sleep(wait_time)
-                        continue
-
-                return response
-
-            except requests.exceptions.Timeout:
-                if attempt < self.retry_attempts:
-                    wait_time = self.retry_backoff * (2**attempt)
-                    self.logger.warning(
-                        f"Request timeout. Retrying in {wait_time} seconds..."
-                    )
-                    time.sleep(wait_time)
-                    continue
-                else:
-                    raise NewsfilterAPIError(
-                        f"Request timeout after {self.retry_attempts} attempts"
-                    )
-
-            except requests.exceptions.ConnectionError:
-                if attempt < self.retry_attempts:
-                    wait_time = self.retry_backoff * (2**attempt)
-                    self.logger.warning(
-                        f"Connection error. Retrying in {wait_time} seconds..."
-                    )
-                    time.sleep(wait_time)
-                    continue
-                else:
-                    raise NewsfilterAPIError(
-                        f"Connection error after {self.retry_attempts} attempts"
-                    )
-
-            except Exception as e:
-                self.logger.error(f"Unexpected error in API request: {str(e)}")
-                raise NewsfilterAPIError(f"Unexpected error: {str(e)}")
-
-        return None
+        except requests.exceptions.Timeout:
+            raise NewsfilterAPIError(
+                f"Request timeout after {self.retry_attempts} attempts"
+            )
+
+        except requests.exceptions.ConnectionError:
+            raise NewsfilterAPIError(
+                f"Connection error after {self.retry_attempts} attempts"
+            )
+
+        except Exception as e:
+            self.logger.error("Unexpected error in API request: %s", e)
+            raise NewsfilterAPIError(f"Unexpected error: {str(e)}")
 
     def get_sources(self) -> List[Dict[str, Any]]:
         """
@@ -248,11 +388,13 @@ class NewsfilterAPIClient:
             if not self.authenticate():
                 raise NewsfilterAPIError("Authentication required")
 
+        import requests
+
         try:
             response = self._make_request("GET", "/sources", authenticate=True)
 
             if response and response.status_code == 200:
-                data = response.json()
+                data = orjson.loads(response.content)
                 return data.get("sources", [])
             else:
                 raise NewsfilterAPIError(
@@ -273,7 +415,7 @@ class NewsfilterAPIClient:
             response = self._make_request("GET", "/rate-limit", authenticate=True)
 
             if response and response.status_code == 200:
-                return response.json()
+                return orjson.loads(response.content)
             else:
                 return {
                     "remaining": 0,
@@ -3,6 +3,8 @@
 import os
 import sys
 import time
+import atexit
+import fcntl
 import logging
 import signal
 from pathlib import Path
@@ -16,7 +18,12 @@ class ProcessLockError(Exception):
 
 
 class ProcessLock:
-    """Manages process locking to ensure only one scraper instance runs at a time"""
+    """Manages process locking to ensure only one scraper instance runs at a time
+
+    Mutual exclusion is provided by an exclusive ``flock`` on the lock file,
+    which the kernel releases automatically when the holding process exits.
+    The file itself only carries informational PID/timestamp/command lines.
+    """
 
     def __init__(
         self,
@@ -39,10 +46,17 @@ class ProcessLock:
 
         self.logger = logging.getLogger(__name__)
         self._locked = False
+        self._fd: Optional[int] = None
+        self._previous_handlers: dict = {}
 
         # Ensure lock directory exists
         self.lock_file.parent.mkdir(parents=True, exist_ok=True)
 
+        try:
+            self._fd = os.open(str(self.lock_file), os.O_CREAT | os.O_RDWR, 0o644)
+        except OSError as e:
+            raise ProcessLockError(f"Could not open lock file: {e}")
+
     def acquire(self, wait: bool = False) -> bool:
         """
         Acquire the process lock
@@ -61,94 +75,137 @@ class ProcessLock:
 
         while True:
             try:
-                # Check if lock file exists
-                if self.lock_file.exists():
-                    if not self._is_process_running():
-                        # Stale lock file - remove it
-                        self._remove_stale_lock()
-                    else:
-                        # Active lock exists
-                        if not wait:
-                            self.logger.info(
-                                "Another scraper instance is already running"
-                            )
-                            return False
-
-                        # Check timeout
-                        if time.time() - start_time >= self.timeout:
-                            self.logger.error(
-                                f"Timeout waiting for lock after {self.timeout} seconds"
-                            )
-                            return False
-
-                        self.logger.info(
-                            f"Waiting for lock... (PID: {self._get_lock_pid()})"
-                        )
-                        time.sleep(self.check_interval)
-                        continue
-
-                # Create lock file
-                self._create_lock_file()
-                self._locked = True
-                self.logger.info(f"Process lock acquired (PID: {self.pid})")
-                return True
+                fcntl.flock(self._fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                break
+
+            except BlockingIOError:
+                # Active lock held by another process
+                if not wait:
+                    self.logger.info("Another scraper instance is already running")
+                    return False
+
+                # Check timeout
+                if time.time() - start_time >= self.timeout:
+                    self.logger.error(
+                        f"Timeout waiting for lock after {self.timeout} seconds"
+                    )
+                    return False
+
+                self.logger.info(f"Waiting for lock... (PID: {self._get_lock_pid()})")
+                time.sleep(self.check_interval)
 
             except OSError as e:
                 self.logger.error(f"Error acquiring lock: {e}")
                 return False
 
+        self._locked = True
+        self._install_cleanup_handlers()
+
+        try:
+            self._write_lock_info()
+        except OSError as e:
+            # The lock itself is held; the file contents are informational
+            self.logger.warning(f"Could not write lock file info: {e}")
+
+        self.logger.info(f"Process lock acquired (PID: {self.pid})")
+        return True
+
     def release(self):
-        """Release the process lock"""
+        """Release the process lock; a no-op if it is not held"""
         if not self._locked:
-            self.logger.warning("Attempting to release lock that wasn't acquired")
             return
 
         try:
-            if self.lock_file.exists():
-                # Verify this is our lock file
-                if self._get_lock_pid() == self.pid:
-                    self.lock_file.unlink()
-                    self.logger.info(f"Process lock released (PID: {self.pid})")
-                else:
-                    self.logger.warning("Lock file PID doesn't match current process")
-
+            os.ftruncate(self._fd, 0)
+            fcntl.flock(self._fd, fcntl.LOCK_UN)
             self._locked = False
+            self.logger.info(f"Process lock released (PID: {self.pid})")
 
         except OSError as e:
             self.logger.error(f"Error releasing lock: {e}")
 
-    def _create_lock_file(self):
-        """Create the lock file with current process information"""
+        finally:
+            self._remove_cleanup_handlers()
+
+    def _install_cleanup_handlers(self):
+        """Release the lock at interpreter exit and on SIGTERM/SIGINT"""
+        atexit.register(self._release_at_exit)
+
+        # Signal handlers can only be installed from the main thread
+        try:
+            for signum in (signal.SIGTERM, signal.SIGINT):
+                previous = signal.getsignal(signum)
+                if previous is signal.SIG_IGN:
+                    continue
+                signal.signal(signum, self._handle_signal)
+                self._previous_handlers[signum] = previous
+        except ValueError:
+            self.logger.debug("Not in main thread, lock signal handlers skipped")
+
+    def _remove_cleanup_handlers(self):
+        """Undo _install_cleanup_handlers"""
+        atexit.unregister(self._release_at_exit)
+
+        for signum, previous in self._previous_handlers.items():
+            try:
+                signal.signal(signum, previous)
+            except ValueError:
+                pass
+        self._previous_handlers = {}
+
+    def _release_at_exit(self):
+        """atexit hook: release the lock if it is still held"""
+        if self._locked:
+            self.release()
+
+    def _handle_signal(self, signum, frame):
+        """Release the lock, then defer to the previously installed handler
+
+        Runs between arbitrary bytecodes, so it must not log: the logging
+        module's locks may already be held by the interrupted code.
+        """
+        previous = self._previous_handlers.get(signum, signal.SIG_DFL)
+
+        if self._locked:
+            try:
+                fcntl.flock(self._fd, fcntl.LOCK_UN)
+            except OSError:
+                pass
+            self._locked = False
+        self._remove_cleanup_handlers()
+
+        if callable(previous):
+            previous(signum, frame)
+        else:
+            # Default action: re-deliver the signal with the default handler
+            signal.signal(signum, signal.SIG_DFL)
+            os.kill(os.getpid(), signum)
+
+    def _write_lock_info(self):
+        """Write current process information to the locked file"""
         lock_data = {
             "pid": self.pid,
             "timestamp": time.time(),
             "command": " ".join(sys.argv),
         }
+        content = (
+            f"{lock_data['pid']}\n{lock_data['timestamp']}\n{lock_data['command']}\n"
+        )
 
-        try:
-            # Use atomic write operation
-            temp_file = self.lock_file.with_suffix(".tmp")
-            with open(temp_file, "w") as f:
-                f.write(f"{lock_data['pid']}\n")
-                f.write(f"{lock_data['timestamp']}\n")
-                f.write(f"{lock_data['command']}\n")
+        os.ftruncate(self._fd, 0)
+        os.pwrite(self._fd, content.encode(), 0)
 
-            # Atomic rename
-            temp_file.rename(self.lock_file)
-
-        except OSError as e:
-            raise ProcessLockError(f"Could not create lock file: {e}")
+    def _read_lock_lines(self) -> list:
+        """Read the informational lines from the lock file"""
+        with open(self.lock_file, "r") as f:
+            return f.readlines()
 
     def _get_lock_pid(self) -> Optional[int]:
         """Get the PID from the lock file"""
         try:
-            if not self.lock_file.exists():
-                return None
-
-            with open(self.lock_file, "r") as f:
-                lines = f.readlines()
-                if lines:
-                    return int(lines[0].strip())
+            lines = self._read_lock_lines()
+            if lines:
+                return int(lines[0].strip())
 
             return None
 
@@ -156,45 +213,17 @@ class ProcessLock:
             self.logger.warning(f"Could not read PID from lock file: {e}")
             return None
 
-    def _is_process_running(self) -> bool:
-        """Check if the process that created the lock is still running"""
-        lock_pid = self._get_lock_pid()
-
-        if lock_pid is None:
-            return False
-
-        try:
-            # Send signal 0 to check if process exists
-            os.kill(lock_pid, 0)
-            return True
-        except OSError:
-            # Process doesn't exist
-            return False
-
-    def _remove_stale_lock(self):
-        """Remove a stale lock file"""
-        try:
-            lock_pid = self._get_lock_pid()
-            self.lock_file.unlink()
-            self.logger.info(f"Removed stale lock file (PID: {lock_pid})")
-        except OSError as e:
-            self.logger.warning(f"Could not remove stale lock file: {e}")
-
     def get_lock_info(self) -> Optional[dict]:
         """Get information about the current lock"""
-        if not self.lock_file.exists():
-            return None
-
         try:
-            with open(self.lock_file, "r") as f:
-                lines = f.readlines()
+            lines = self._read_lock_lines()
 
             if len(lines) >= 3:
                 return {
                     "pid": int(lines[0].strip()),
                     "timestamp": float(lines[1].strip()),
                     "command": lines[2].strip(),
-                    "running": self._is_process_running(),
+                    "running": self.is_locked(),
                 }
 
             return None
@@ -205,10 +234,31 @@ class ProcessLock:
 
     def is_locked(self) -> bool:
         """Check if a valid lock exists"""
-        return self.lock_file.exists() and self._is_process_running()
+        if self._locked:
+            return True
+
+        # Probe with a separate open file description; flock locks held by
+        # other processes conflict with it
+        try:
+            fd = os.open(str(self.lock_file), os.O_RDONLY)
+        except FileNotFoundError:
+            return False
+
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            fcntl.flock(fd, fcntl.LOCK_UN)
+            return False
+        except BlockingIOError:
+            return True
+        finally:
+            os.close(fd)
 
     def force_release(self):
-        """Force release of the lock (use with extreme caution)"""
+        """Force release of the lock (use with extreme caution)
+
+        The holder's kernel lock cannot be revoked; removing the file lets new
+        processes lock a fresh file while the old holder keeps running.
+        """
         try:
             if self.lock_file.exists():
                 lock_info = self.get_lock_info()
@@ -219,6 +269,15 @@ class ProcessLock:
         except OSError as e:
             self.logger.error(f"Could not force release lock: {e}")
 
+    def close(self):
+        """Release the lock if held and close the lock file descriptor"""
+        if self._locked:
+            self.release()
+
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+
     def __enter__(self):
         """Context manager entry"""
         if not self.acquire():
@@ -231,5 +290,5 @@ class ProcessLock:
 
     def __del__(self):
         """Cleanup lock on object destruction"""
-        if self._locked:
-            self.release()
+        if getattr(self, "_fd", None) is not None:
+            self.close()
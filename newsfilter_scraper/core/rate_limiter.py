@@ -1,10 +1,18 @@
 # Track and enforce 100 API calls per 24 hour limit
 
-import json
+import fcntl
 import logging
+import os
+import struct
+from contextlib import contextmanager
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, Iterator, Optional, Tuple
+
+import orjson
+
+# On-disk record: request count and last reset time (epoch seconds)
+_RECORD = struct.Struct("<QQ")
 
 
 class RateLimiter:
@@ -13,7 +21,7 @@ class RateLimiter:
     def __init__(
         self,
         max_requests: int = 100,
-        tracking_file: str = "data/rate_limit.json",
+        tracking_file: str = "data/rate_limit.bin",
         reset_hour: int = 0,
     ):
         """
@@ -26,65 +34,125 @@ class RateLimiter:
         """
         self.max_requests = max_requests
         self.tracking_file = Path(tracking_file)
+        # Previous versions kept JSON state in data/rate_limit.json
+        self.legacy_file = self.tracking_file.with_suffix(".json")
         self.reset_hour = reset_hour
 
         self.logger = logging.getLogger(__name__)
 
-        # Ensure the tracking file directory exists
-        self.tracking_file.parent.mkdir(parents=True, exist_ok=True)
+        # Reset boundaries only move once a day; recomputed when crossed
+        self._cached_reset_boundary: Optional[datetime] = None
+        self._cached_next_boundary: Optional[datetime] = None
+
+        # Kept open for the limiter's lifetime; updates are 16-byte pwrites.
+        # Without a usable file, usage is only counted in memory.
+        self._fd: Optional[int] = None
+        try:
+            self.tracking_file.parent.mkdir(parents=True, exist_ok=True)
+            self._fd = os.open(str(self.tracking_file), os.O_CREAT | os.O_RDWR, 0o644)
+        except OSError as e:
+            self.logger.warning(
+                f"Could not open rate limit file {self.tracking_file}: {e}. "
+                "Usage will only be tracked in memory."
+            )
 
         # Initialize tracking data
         self._load_tracking_data()
 
+    @contextmanager
+    def _file_lock(self) -> Iterator[None]:
+        """Hold an exclusive lock on the tracking file across processes"""
+        if self._fd is None:
+            yield
+            return
+
+        fcntl.flock(self._fd, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(self._fd, fcntl.LOCK_UN)
+
+    def _read_record(self) -> Optional[Tuple[int, int]]:
+        """Read (count, reset epoch) from the tracking file"""
+        if self._fd is None:
+            return None
+
+        buf = os.pread(self._fd, _RECORD.size + 1, 0)
+        if len(buf) == _RECORD.size:
+            return _RECORD.unpack(buf)
+
+        if buf.startswith(b"{"):
+            return self._read_legacy_json(self.tracking_file)
+
+        if not buf and self.legacy_file.exists():
+            return self._read_legacy_json(self.legacy_file)
+
+        return None
+
+    def _read_legacy_json(self, path: Path) -> Optional[Tuple[int, int]]:
+        """Read a tracking file written in the previous JSON format"""
+        try:
+            with open(path, "rb") as f:
+                data = orjson.loads(f.read())
+            last_reset = datetime.fromisoformat(data["last_reset"])
+            self.logger.info(f"Migrating JSON rate limit data from {path}")
+            return int(data["daily_usage"]), int(last_reset.timestamp())
+        except (orjson.JSONDecodeError, KeyError, TypeError, ValueError, OSError) as e:
+            self.logger.warning(f"Could not migrate JSON rate limit data: {e}")
+            return None
+
+    def _write_record(self):
+        """Write the in-memory counter to the tracking file"""
+        if self._fd is None:
+            return
+
+        record = _RECORD.pack(self.data["daily_usage"], self._last_reset_ts)
+        os.pwrite(self._fd, record, 0)
+        os.ftruncate(self._fd, _RECORD.size)
+
+    def _set_state(self, daily_usage: int, last_reset_ts: int):
+        """Update the in-memory counter"""
+        self._last_reset_ts = last_reset_ts
+        self.data = {
+            "daily_usage": daily_usage,
+            "last_reset": datetime.fromtimestamp(last_reset_ts),
+            "max_requests": self.max_requests,
+        }
+
     def _load_tracking_data(self):
         """Load rate limit tracking data from file"""
         try:
-            if self.tracking_file.exists():
-                with open(self.tracking_file, "r") as f:
-                    self.data = json.load(f)
-
-                # Validate data structure
-                if not isinstance(self.data, dict):
-                    self._initialize_tracking_data()
-                elif "daily_usage" not in self.data or "last_reset" not in self.data:
+            with self._file_lock():
+                record = self._read_record()
+                if record is None:
                     self._initialize_tracking_data()
                 else:
-                    # Convert last_reset string back to datetime
-                    if self.data["last_reset"]:
-                        self.data["last_reset"] = datetime.fromisoformat(
-                            self.data["last_reset"]
-                        )
-            else:
-                self._initialize_tracking_data()
-
-        except (json.JSONDecodeError, ValueError, OSError) as e:
+                    self._set_state(*record)
+                    # Persist state migrated from JSON in the binary format
+                    if self._fd is not None and (
+                        os.fstat(self._fd).st_size != _RECORD.size
+                    ):
+                        self._write_record()
+
+        except OSError as e:
             self.logger.warning(
                 f"Could not load rate limit data: {e}. Initializing fresh data."
             )
-            self._initialize_tracking_data()
+            self._set_state(0, int(self._get_last_reset_time().timestamp()))
 
         # Check if we need to reset the counter
         self._check_reset_needed()
 
     def _initialize_tracking_data(self):
         """Initialize fresh tracking data"""
-        self.data = {
-            "daily_usage": 0,
-            "last_reset": self._get_last_reset_time(),
-            "max_requests": self.max_requests,
-        }
-        self._save_tracking_data()
+        self._set_state(0, int(self._get_last_reset_time().timestamp()))
+        self._write_record()
 
     def _save_tracking_data(self):
         """Save tracking data to file"""
         try:
-            # Convert datetime to string for JSON serialization
-            data_to_save = self.data.copy()
-            if data_to_save["last_reset"]:
-                data_to_save["last_reset"] = data_to_save["last_reset"].isoformat()
-
-            with open(self.tracking_file, "w") as f:
-                json.dump(data_to_save, f, indent=2)
+            with self._file_lock():
+                self._write_record()
 
         except OSError as e:
             self.logger.error(f"Could not save rate limit data: {e}")
@@ -93,6 +161,12 @@ class RateLimiter:
         """Get the datetime of the last reset boundary"""
         now = datetime.now()
 
+        if (
+            self._cached_next_boundary is not None
+            and self._cached_reset_boundary <= now < self._cached_next_boundary
+        ):
+            return self._cached_reset_boundary
+
         # Calculate the most recent reset time
         reset_time = now.replace(
             hour=self.reset_hour, minute=0, second=0, microsecond=0
@@ -102,16 +176,17 @@ class RateLimiter:
         if now < reset_time:
             reset_time = reset_time - timedelta(days=1)
 
+        self._cached_reset_boundary = reset_time
+        self._cached_next_boundary = reset_time + timedelta(days=1)
         return reset_time
 
     def _check_reset_needed(self):
         """Check if we need to reset the usage counter"""
-        current_reset_time = self._get_last_reset_time()
+        current_reset_ts = int(self._get_last_reset_time().timestamp())
 
-        if not self.data["last_reset"] or current_reset_time > self.data["last_reset"]:
+        if current_reset_ts > self._last_reset_ts:
             old_usage = self.data["daily_usage"]
-            self.data["daily_usage"] = 0
-            self.data["last_reset"] = current_reset_time
+            self._set_state(0, current_reset_ts)
             self._save_tracking_data()
 
             self.logger.info(
@@ -132,11 +207,23 @@ class RateLimiter:
         """Record that an API request was made"""
         self._check_reset_needed()
 
-        if self.data["daily_usage"] >= self.max_requests:
-            self.logger.warning("Attempting to record request when rate limit exceeded")
+        try:
+            with self._file_lock():
+                # Pick up requests recorded by other processes since our last read
+                record = self._read_record()
+                if record is not None and record[1] == self._last_reset_ts:
+                    self.data["daily_usage"] = max(self.data["daily_usage"], record[0])
 
-        self.data["daily_usage"] += 1
-        self._save_tracking_data()
+                if self.data["daily_usage"] >= self.max_requests:
+                    self.logger.warning(
+                        "Attempting to record request when rate limit exceeded"
+                    )
+
+                self.data["daily_usage"] += 1
+                self._write_record()
+
+        except OSError as e:
+            self.logger.error(f"Could not save rate limit data: {e}")
 
         self.logger.debug(
             f"API request recorded. Usage: {self.data['daily_usage']}/{self.max_requests}"
@@ -173,16 +260,8 @@ class RateLimiter:
 
     def _get_next_reset_time(self) -> datetime:
         """Get the datetime of the next reset"""
-        now = datetime.now()
-        next_reset = now.replace(
-            hour=self.reset_hour, minute=0, second=0, microsecond=0
-        )
-
-        # If we've already passed today's reset time, the next reset is tomorrow
-        if now >= next_reset:
-            next_reset = next_reset + timedelta(days=1)
-
-        return next_reset
+        self._get_last_reset_time()
+        return self._cached_next_boundary
 
     def get_time_until_reset(self) -> timedelta:
         """Get the time remaining until the next reset"""
@@ -191,8 +270,7 @@ class RateLimiter:
     def force_reset(self):
         """Force a reset of the rate limit counter (use with caution)"""
         old_usage = self.data["daily_usage"]
-        self.data["daily_usage"] = 0
-        self.data["last_reset"] = datetime.now()
+        self._set_state(0, int(datetime.now().timestamp()))
         self._save_tracking_data()
 
         self.logger.warning(
@@ -220,3 +298,17 @@ class RateLimiter:
             "remaining_after": max(0, self.max_requests - new_usage),
             "percentage_after": (new_usage / self.max_requests) * 100,
         }
+
+    def close(self):
+        """Close the tracking file"""
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+
+    def __enter__(self):
+        """Context manager entry"""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Context manager exit"""
+        self.close()
@@ -1,6 +1,6 @@
 # SQLAlchemy models for newsfilter.io data
 
-from sqlalchemy import Column, String, Text, DateTime, ForeignKey, Table
+from sqlalchemy import Column, String, Text, DateTime, ForeignKey, Index, Table
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import relationship
 from datetime import datetime
@@ -13,6 +13,10 @@ article_symbols = Table(
     Base.metadata,
     Column("article_id", String(255), ForeignKey("articles.id"), primary_key=True),
     Column("symbol_id", String(20), ForeignKey("symbols.symbol"), primary_key=True),
+    # Reverse direction of the composite PK for "articles by symbol" lookups
+    Index("ix_article_symbols_symbol", "symbol_id", "article_id"),
+    # The PK covers every column, so SQLite can store rows in the PK b-tree
+    sqlite_with_rowid=False,
 )
 
 article_industries = Table(
@@ -20,6 +24,8 @@ article_industries = Table(
     Base.metadata,
     Column("article_id", String(255), ForeignKey("articles.id"), primary_key=True),
     Column("industry_id", String(100), ForeignKey("industries.name"), primary_key=True),
+    Index("ix_article_industries_industry", "industry_id", "article_id"),
+    sqlite_with_rowid=False,
 )
 
 article_sectors = Table(
@@ -27,11 +33,15 @@ article_sectors = Table(
     Base.metadata,
     Column("article_id", String(255), ForeignKey("articles.id"), primary_key=True),
     Column("sector_id", String(100), ForeignKey("sectors.name"), primary_key=True),
+    Index("ix_article_sectors_sector", "sector_id", "article_id"),
+    sqlite_with_rowid=False,
 )
 
 
 class Source(Base):
     __tablename__ = "sources"
+    # Clustered on the natural key; SQLite only, ignored elsewhere
+    __table_args__ = {"sqlite_with_rowid": False}
 
     id = Column(String(100), primary_key=True)
     name = Column(String(255), nullable=False)
@@ -47,6 +57,7 @@ class Source(Base):
 
 class Symbol(Base):
     __tablename__ = "symbols"
+    __table_args__ = {"sqlite_with_rowid": False}
 
     symbol = Column(String(20), primary_key=True)
     created_at = Column(DateTime, default=datetime.utcnow)
@@ -62,6 +73,7 @@ class Symbol(Base):
 
 class Industry(Base):
     __tablename__ = "industries"
+    __table_args__ = {"sqlite_with_rowid": False}
 
     name = Column(String(100), primary_key=True)
     created_at = Column(DateTime, default=datetime.utcnow)
@@ -77,6 +89,7 @@ class Industry(Base):
 
 class Sector(Base):
     __tablename__ = "sectors"
+    __table_args__ = {"sqlite_with_rowid": False}
 
     name = Column(String(100), primary_key=True)
     created_at = Column(DateTime, default=datetime.utcnow)
@@ -107,6 +120,11 @@ class Article(Base):
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
+    __table_args__ = (
+        Index("ix_articles_published_at", published_at.desc()),
+        Index("ix_articles_source_published", "source_id", "published_at"),
+    )
+
     # Relationships
     source = relationship("Source", back_populates="articles")
     symbols = relationship(
@@ -13,7 +13,10 @@ This script orchestrates the entire scraping process:
 import sys
 import traceback
 from datetime import datetime
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Optional, Tuple
+
+from dateutil import parser as date_parser
+from sqlalchemy import Table, select
 
 # Import configuration and logging first
 from config.settings import Settings
@@ -26,9 +29,31 @@ from core.api_client import NewsfilterAPIClient
 from core.database import DatabaseManager
 
 # Models and utilities
-from models.models import Article, Source, Symbol, Industry, Sector
+from models.models import (
+    Article,
+    Source,
+    Symbol,
+    Industry,
+    Sector,
+    article_industries,
+    article_sectors,
+    article_symbols,
+)
 from utils.stats import ScraperStats
 
+# Longer ids cannot be stored: MySQL INSERT IGNORE would truncate them with
+# only a warning, letting two ids collide, so they are rejected and counted
+MAX_ARTICLE_ID_LENGTH = Article.__table__.c.id.type.length
+
+
+def _parse_published_at(value: str) -> datetime:
+    """Parse an API timestamp, using the C ISO-8601 parser when possible"""
+    try:
+        # fromisoformat only accepts a trailing "Z" from Python 3.11
+        return datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        return date_parser.parse(value)
+
 
 class NewsfilterScraper:
     """Main scraper class that coordinates all scraping operations"""
@@ -44,12 +69,22 @@ class NewsfilterScraper:
             max_requests=self.settings.MAX_DAILY_REQUESTS,
             tracking_file=self.settings.RATE_LIMIT_FILE,
         )
+        # Built once: its pooled requests.Session lets authenticate() and the
+        # article fetch reuse one kept-alive connection
         self.api_client = NewsfilterAPIClient(
             api_key=self.settings.NEWSFILTER_API_KEY,
             base_url=self.settings.NEWSFILTER_API_URL,
         )
         self.db_manager = DatabaseManager(self.settings.DATABASE_URL)
 
+        # Rate limiter usage as of the last check
+        self._usage_snapshot: Optional[Dict[str, Any]] = None
+
+        # Natural keys of stored dimension rows per model, loaded per batch,
+        # and the rows still to be inserted for newly seen keys
+        self._known: Dict[type, set] = {}
+        self._pending: Dict[type, List[Dict[str, Any]]] = {}
+
     def run(self) -> bool:
         """
         Main execution method
@@ -83,7 +118,10 @@ class NewsfilterScraper:
             return False
 
         finally:
-            # Always release the lock
+            # Close pooled connections and the rate limit file, then always
+            # release the lock
+            self.db_manager.close()
+            self.rate_limiter.close()
             self._release_lock()
 
     def _acquire_lock(self) -> bool:
@@ -102,16 +140,19 @@ class NewsfilterScraper:
     def _check_rate_limits(self) -> bool:
         """Check if we can make API calls within rate limits"""
         try:
-            if self.rate_limiter.can_make_request():
-                current_usage = self.rate_limiter.get_current_usage()
+            # One in-memory read of the limiter state serves the check and
+            # the log line; the snapshot is kept for later reporting
+            usage = self.rate_limiter.get_current_usage()
+            self._usage_snapshot = usage
+
+            if not usage["rate_limited"]:
                 self.logger.info(
-                    f"Rate limit check passed: {current_usage['daily_usage']}/{current_usage['max_requests']} calls used today"
+                    f"Rate limit check passed: {usage['daily_usage']}/{usage['max_requests']} calls used today"
                 )
                 return True
             else:
-                current_usage = self.rate_limiter.get_current_usage()
                 self.logger.warning(
-                    f"Rate limit exceeded: {current_usage['daily_usage']}/{current_usage['max_requests']} calls used today"
+                    f"Rate limit exceeded: {usage['daily_usage']}/{usage['max_requests']} calls used today"
                 )
                 return False
         except Exception as e:
@@ -122,9 +163,6 @@ class NewsfilterScraper:
         """Main scraping and processing logic"""
         session = None
         try:
-            # Get database session
-            session = self.db_manager.get_session()
-
             # Authenticate with API
             if not self.api_client.authenticate():
                 self.logger.error("API authentication failed")
@@ -137,6 +175,13 @@ class NewsfilterScraper:
             if articles_data is None:
                 return False
 
+            # Nothing to store, skip the database entirely
+            if not articles_data:
+                return True
+
+            # Get database session; the import path flushes explicitly
+            session = self.db_manager.get_session(bulk=True)
+
             # Process and store articles
             return self._process_articles(session, articles_data)
 
@@ -150,11 +195,12 @@ class NewsfilterScraper:
             if session:
                 session.close()
 
-    def _fetch_articles(self) -> List[Dict[str, Any]] | None:
+    def _fetch_articles(self) -> Optional[List[Dict[str, Any]]]:
         """Fetch articles from the API"""
         try:
-            # Record API usage
+            # Record API usage and refresh the snapshot reported at the end
             self.rate_limiter.record_request()
+            self._usage_snapshot = self.rate_limiter.get_current_usage()
 
             # Make API call
             articles = self.api_client.get_articles()
@@ -174,43 +220,94 @@ class NewsfilterScraper:
             return None
 
     def _process_articles(self, session, articles_data: List[Dict[str, Any]]) -> bool:
-        """Process and store articles in database"""
+        """Process and store articles in database
+
+        New articles are collected as plain rows in a first pass and written
+        with one multi-row INSERT per table in a second pass.
+        """
         try:
+            # Drop repeated ids within the batch up front, keeping the first
+            # copy; articles without an id are keyed by position so they still
+            # fail individually below
+            unique_articles: Dict[Any, Dict[str, Any]] = {}
+            for i, article_data in enumerate(articles_data):
+                unique_articles.setdefault(article_data.get("id", i), article_data)
+            self.stats.articles_duplicate += len(articles_data) - len(unique_articles)
+            articles_data = list(unique_articles.values())
+
+            # Look up which of the fetched articles are already stored in a
+            # single query instead of one per article
+            ids = [a["id"] for a in articles_data if "id" in a]
+            existing_ids = set(
+                session.scalars(select(Article.id).where(Article.id.in_(ids)))
+            )
+
+            # The dimension tables are small, so load their keys once and
+            # diff names against them instead of querying per reference
+            self._known = {
+                Source: set(session.scalars(select(Source.id))),
+                Symbol: set(session.scalars(select(Symbol.symbol))),
+                Industry: set(session.scalars(select(Industry.name))),
+                Sector: set(session.scalars(select(Sector.name))),
+            }
+            self._pending = {model: [] for model in self._known}
+
+            article_rows = []
+            link_rows = {
+                article_symbols: [],
+                article_industries: [],
+                article_sectors: [],
+            }
+
             for article_data in articles_data:
                 try:
                     # Check if article already exists
-                    existing_article = (
-                        session.query(Article).filter_by(id=article_data["id"]).first()
-                    )
-
-                    if existing_article:
+                    if article_data["id"] in existing_ids:
                         self.stats.articles_duplicate += 1
                         self.logger.debug(
-                            f"Article {article_data['id']} already exists, skipping"
+                            "Article %s already exists, skipping", article_data["id"]
                         )
                         continue
 
-                    # Create new article
-                    article = self._create_article_from_data(session, article_data)
+                    # Build the new article's rows
+                    prepared = self._article_rows_from_data(article_data)
 
-                    if article:
-                        self.stats.articles_processed += 1
-                        self.logger.debug(
-                            f"Successfully processed article: {article.id}"
-                        )
+                    if prepared:
+                        row, links = prepared
+                        article_rows.append(row)
+                        for table, rows in links.items():
+                            link_rows[table].extend(rows)
+
+                        self.logger.debug("Prepared article: %s", row["id"])
+                    else:
+                        # Conversion errors are logged by _article_rows_from_data
+                        self.stats.articles_failed += 1
 
                 except Exception as e:
                     self.logger.error(
-                        f"Failed to process article {article_data.get('id', 'unknown')}: {str(e)}"
+                        "Failed to process article %s: %s",
+                        article_data.get("id", "unknown"),
+                        e,
                     )
                     self.stats.articles_failed += 1
                     # Continue processing other articles
                     continue
 
+            # Write new dimension rows, articles and association rows with one
+            # multi-row INSERT per table
+            inserted_ids = self.db_manager.bulk_insert_articles(
+                session, article_rows, self._pending, link_rows
+            )
+
             # Commit all changes
             session.commit()
+
+            # Rows a concurrent run stored after the existence check were
+            # skipped by the insert and count as duplicates
+            self.stats.articles_processed += len(inserted_ids)
+            self.stats.articles_duplicate += len(article_rows) - len(inserted_ids)
             self.logger.info(
-                f"Successfully committed {self.stats.articles_processed} new articles to database"
+                f"Successfully committed {len(inserted_ids)} new articles to database"
             )
 
             return True
@@ -220,93 +317,129 @@ class NewsfilterScraper:
             session.rollback()
             return False
 
-    def _create_article_from_data(
-        self, session, article_data: Dict[str, Any]
-    ) -> Article | None:
-        """Create Article and related entities from API data"""
-        try:
-            from dateutil import parser
+    def _article_rows_from_data(
+        self, article_data: Dict[str, Any]
+    ) -> Optional[Tuple[Dict[str, Any], Dict[Table, List[Dict[str, str]]]]]:
+        """
+        Build the article row and its association rows from API data
 
-            # Parse published date
-            published_at = parser.parse(article_data["publishedAt"])
+        Related sources, symbols, industries and sectors are queued for
+        insertion as needed.
+
+        Returns:
+            The article column dict and association rows keyed by table, or
+            None if the data could not be converted
+        """
+        try:
+            # Build the article row first so malformed data fails before any
+            # dimension rows are queued
+            source_data = article_data["source"]
+            row = self._article_row(article_data, source_data["id"])
+            article_id = row["id"]
 
             # Get or create source
-            source = self._get_or_create_source(session, article_data["source"])
-
-            # Create article
-            article = Article(
-                id=article_data["id"],
-                title=article_data["title"],
-                description=article_data.get("description", ""),
-                source_url=article_data["sourceUrl"],
-                image_url=article_data.get("imageUrl"),
-                published_at=published_at,
-                source_id=source.id,
+            self._get_or_create(
+                Source,
+                source_data["id"],
+                {"id": source_data["id"], "name": source_data["name"]},
+                "sources_created",
             )
 
-            # Add symbols
-            for symbol_name in article_data.get("symbols", []):
-                symbol = self._get_or_create_symbol(session, symbol_name)
-                article.symbols.append(symbol)
+            # Names are de-duplicated so an association row is written once
+            links = {
+                article_symbols: [
+                    {
+                        "article_id": article_id,
+                        "symbol_id": self._get_or_create(
+                            Symbol, name, {"symbol": name}, "symbols_created"
+                        ),
+                    }
+                    for name in dict.fromkeys(article_data.get("symbols", []))
+                ],
+                article_industries: [
+                    {
+                        "article_id": article_id,
+                        "industry_id": self._get_or_create(
+                            Industry, name, {"name": name}, "industries_created"
+                        ),
+                    }
+                    for name in dict.fromkeys(article_data.get("industries", []))
+                ],
+                article_sectors: [
+                    {
+                        "article_id": article_id,
+                        "sector_id": self._get_or_create(
+                            Sector, name, {"name": name}, "sectors_created"
+                        ),
+                    }
+                    for name in dict.fromkeys(article_data.get("sectors", []))
+                ],
+            }
+
+            return row, links
 
-            # Add industries
-            for industry_name in article_data.get("industries", []):
-                industry = self._get_or_create_industry(session, industry_name)
-                article.industries.append(industry)
+        except Exception as e:
+            self.logger.error("Failed to create article from data: %s", e)
+            return None
 
-            # Add sectors
-            for sector_name in article_data.get("sectors", []):
-                sector = self._get_or_create_sector(session, sector_name)
-                article.sectors.append(sector)
+    def _article_row(self, article_data: Dict[str, Any], source_id: str) -> dict:
+        """
+        Build the articles table row for one API article
 
-            session.add(article)
-            session.flush()  # Ensure ID is available
+        Args:
+            article_data: Article as returned by the API
+            source_id: Natural key of the article's source
 
-            return article
+        Returns:
+            dict: Column values for the Article insert; a ValueError is
+            raised if the article id does not fit the id column
+        """
+        article_id = article_data["id"]
+        if len(article_id) > MAX_ARTICLE_ID_LENGTH:
+            raise ValueError(
+                f"Article id longer than {MAX_ARTICLE_ID_LENGTH} characters: "
+                f"{article_id[:MAX_ARTICLE_ID_LENGTH]}..."
+            )
 
-        except Exception as e:
-            self.logger.error(f"Failed to create article from data: {str(e)}")
-            return None
+        get = article_data.get
+        return {
+            "id": article_id,
+            "title": article_data["title"],
+            "description": get("description", ""),
+            "source_url": article_data["sourceUrl"],
+            "image_url": get("imageUrl"),
+            "published_at": _parse_published_at(article_data["publishedAt"]),
+            "source_id": source_id,
+        }
+
+    def _get_or_create(
+        self,
+        model: type,
+        key: str,
+        create_kwargs: Dict[str, Any],
+        stats_attr: str,
+    ) -> str:
+        """
+        Resolve a dimension row by natural key, queueing it if it is new
+
+        Queued rows are written with one multi-row INSERT per model before
+        the articles that reference them.
+
+        Args:
+            model: Source, Symbol, Industry or Sector
+            key: Natural key of the row
+            create_kwargs: Column values used when the row is created
+            stats_attr: ScraperStats counter incremented on creation
 
-    def _get_or_create_source(self, session, source_data: Dict[str, str]) -> Source:
-        """Get existing source or create new one"""
-        source = session.query(Source).filter_by(id=source_data["id"]).first()
-        if not source:
-            source = Source(id=source_data["id"], name=source_data["name"])
-            session.add(source)
-            session.flush()
-            self.stats.sources_created += 1
-        return source
-
-    def _get_or_create_symbol(self, session, symbol_name: str) -> Symbol:
-        """Get existing symbol or create new one"""
-        symbol = session.query(Symbol).filter_by(symbol=symbol_name).first()
-        if not symbol:
-            symbol = Symbol(symbol=symbol_name)
-            session.add(symbol)
-            session.flush()
-            self.stats.symbols_created += 1
-        return symbol
-
-    def _get_or_create_industry(self, session, industry_name: str) -> Industry:
-        """Get existing industry or create new one"""
-        industry = session.query(Industry).filter_by(name=industry_name).first()
-        if not industry:
-            industry = Industry(name=industry_name)
-            session.add(industry)
-            session.flush()
-            self.stats.industries_created += 1
-        return industry
-
-    def _get_or_create_sector(self, session, sector_name: str) -> Sector:
-        """Get existing sector or create new one"""
-        sector = session.query(Sector).filter_by(name=sector_name).first()
-        if not sector:
-            sector = Sector(name=sector_name)
-            session.add(sector)
-            session.flush()
-            self.stats.sectors_created += 1
-        return sector
+        Returns:
+            str: The natural key, usable as a foreign key value
+        """
+        known = self._known[model]
+        if key not in known:
+            known.add(key)
+            self._pending[model].append(create_kwargs)
+            setattr(self.stats, stats_attr, getattr(self.stats, stats_attr) + 1)
+        return key
 
     def _log_final_stats(self, start_time: datetime, success: bool):
         """Log comprehensive statistics about the scraper run"""
@@ -330,7 +463,9 @@ class NewsfilterScraper:
         self.logger.info(f"New sectors created: {self.stats.sectors_created}")
 
         # Log rate limit status
-        current_usage = self.rate_limiter.get_current_usage()
+        current_usage = self._usage_snapshot
+        if current_usage is None:
+            current_usage = self.rate_limiter.get_current_usage()
         self.logger.info(
             f"API usage today: {current_usage['daily_usage']}/{current_usage['max_requests']}"
         )
@@ -0,0 +1,7 @@
+# Shared pytest configuration
+
+import sys
+from pathlib import Path
+
+# Modules import each other as top-level packages (core, models, utils...)
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
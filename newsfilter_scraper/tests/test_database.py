@@ -0,0 +1,103 @@
+# Tests for DatabaseManager bulk inserts
+
+from datetime import datetime
+
+import pytest
+from sqlalchemy import select
+
+from core.database import DatabaseManager
+from models.models import Article, Source, Symbol, article_symbols
+
+
+@pytest.fixture
+def db():
+    manager = DatabaseManager("sqlite:///:memory:")
+    manager.create_tables()
+    yield manager
+    manager.close()
+
+
+def _article(article_id: str) -> dict:
+    return {
+        "id": article_id,
+        "title": "Title",
+        "description": None,
+        "source_url": "https://example.com",
+        "image_url": None,
+        "published_at": datetime(2024, 1, 2, 3, 4, 5),
+        "source_id": "s1",
+    }
+
+
+def _insert(db, rows, symbols, links):
+    session = db.get_session(bulk=True)
+    try:
+        inserted = db.bulk_insert_articles(
+            session,
+            rows,
+            {Source: [{"id": "s1", "name": "S1"}], Symbol: symbols},
+            {article_symbols: links},
+        )
+        session.commit()
+        return inserted
+    finally:
+        session.close()
+
+
+def _links(db):
+    session = db.get_session()
+    try:
+        return {tuple(row) for row in session.execute(select(article_symbols))}
+    finally:
+        session.close()
+
+
+@pytest.mark.parametrize("returning", [True, False])
+def test_bulk_insert_skips_duplicates_and_their_links(db, monkeypatch, returning):
+    # False exercises the SELECT ... FOR UPDATE path used without RETURNING
+    monkeypatch.setattr(db.engine.dialect, "insert_executemany_returning", returning)
+
+    inserted = _insert(
+        db,
+        [_article("a1"), _article("a2")],
+        [{"symbol": "AAPL"}],
+        [{"article_id": "a1", "symbol_id": "AAPL"}],
+    )
+    assert inserted == {"a1", "a2"}
+
+    # a1 already exists, so its new link must not be added
+    inserted = _insert(
+        db,
+        [_article("a1"), _article("a3")],
+        [{"symbol": "AAPL"}, {"symbol": "MSFT"}],
+        [
+            {"article_id": "a1", "symbol_id": "MSFT"},
+            {"article_id": "a3", "symbol_id": "MSFT"},
+        ],
+    )
+    assert inserted == {"a3"}
+    assert _links(db) == {("a1", "AAPL"), ("a3", "MSFT")}
+
+    session = db.get_session()
+    try:
+        assert session.scalars(select(Article.id).order_by(Article.id)).all() == [
+            "a1",
+            "a2",
+            "a3",
+        ]
+        assert session.scalars(select(Symbol.symbol).order_by(Symbol.symbol)).all() == [
+            "AAPL",
+            "MSFT",
+        ]
+    finally:
+        session.close()
+
+
+def test_bulk_insert_without_articles_still_adds_dimensions(db):
+    assert _insert(db, [], [{"symbol": "AAPL"}], []) == set()
+
+    session = db.get_session()
+    try:
+        assert session.scalars(select(Symbol.symbol)).all() == ["AAPL"]
+    finally:
+        session.close()
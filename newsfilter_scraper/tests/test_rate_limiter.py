@@ -0,0 +1,51 @@
+# Tests for RateLimiter persistence
+
+from datetime import datetime
+
+import orjson
+
+from core.rate_limiter import RateLimiter
+
+
+def test_migrates_legacy_json_file(tmp_path):
+    legacy = tmp_path / "rate_limit.json"
+    legacy.write_bytes(
+        orjson.dumps(
+            {
+                "daily_usage": 7,
+                "last_reset": datetime.now().isoformat(),
+                "max_requests": 100,
+            }
+        )
+    )
+
+    tracking_file = tmp_path / "rate_limit.bin"
+    limiter = RateLimiter(max_requests=100, tracking_file=str(tracking_file))
+    try:
+        assert limiter.get_current_usage()["daily_usage"] == 7
+    finally:
+        limiter.close()
+
+    # The migrated state is now stored as a single binary record
+    assert tracking_file.stat().st_size == 16
+
+    limiter = RateLimiter(max_requests=100, tracking_file=str(tracking_file))
+    try:
+        limiter.record_request()
+        assert limiter.get_current_usage()["daily_usage"] == 8
+    finally:
+        limiter.close()
+
+
+def test_counts_in_memory_when_file_cannot_be_opened(tmp_path):
+    blocker = tmp_path / "not_a_dir"
+    blocker.write_text("")
+
+    limiter = RateLimiter(max_requests=2, tracking_file=str(blocker / "rate_limit.bin"))
+    try:
+        limiter.record_request()
+        limiter.record_request()
+        assert limiter.get_current_usage()["daily_usage"] == 2
+        assert not limiter.can_make_request()
+    finally:
+        limiter.close()
@@ -0,0 +1,27 @@
+# Tests for ScraperStats history storage
+
+import orjson
+
+from utils.stats import ScraperStats
+
+
+def test_migrates_legacy_json_history(tmp_path):
+    runs = [{"run_id": "r1", "success": True}, {"run_id": "r2", "success": False}]
+    (tmp_path / "scraper_stats.json").write_bytes(orjson.dumps(runs))
+
+    stats_file = tmp_path / "scraper_stats.ndjson"
+    stats = ScraperStats(str(stats_file))
+
+    assert list(stats.historical_stats) == runs
+    lines = stats_file.read_bytes().splitlines()
+    assert [orjson.loads(line) for line in lines] == runs
+
+
+def test_existing_history_is_not_overwritten(tmp_path):
+    (tmp_path / "scraper_stats.json").write_bytes(orjson.dumps([{"run_id": "old"}]))
+    stats_file = tmp_path / "scraper_stats.ndjson"
+    stats_file.write_bytes(orjson.dumps({"run_id": "new"}) + b"\n")
+
+    stats = ScraperStats(str(stats_file))
+
+    assert list(stats.historical_stats) == [{"run_id": "new"}]
@@ -1,12 +1,19 @@
 # Logging utilities and helpers
 
+import functools
 import logging
-import logging.config
+import os
+import platform
 import sys
+import time
+import traceback
 from pathlib import Path
 from typing import Optional
 
-from config.logging_config import LoggingConfig
+from config.logging_config import LOG_CONTEXT, LoggingConfig
+
+# Monotonic, high resolution clock for measuring durations
+_perf = time.perf_counter
 
 
 def setup_logger(
@@ -23,21 +30,29 @@ def setup_logger(
         logging.Logger: Configured root logger
     """
 
+    # Only needed here; logging.config pulls in socketserver and friends
+    import logging.config
+
     # Create logging configuration
     logging_config = LoggingConfig()
 
+    # Quiet noisy libraries regardless of which configuration ends up applied
+    configure_third_party_loggers()
+
     # Apply the configuration
     try:
         logging.config.dictConfig(logging_config.get_config())
-
-        # Setup custom handlers that can't be configured via dictConfig
-        logging_config._create_logger_config()
+        logging_config.start_queue_listener()
 
         # Get the root logger
         logger = logging.getLogger()
 
-        # Log system information
-        log_system_info()
+        # Log system information, except under cron where it would repeat
+        # identically on every scheduled run
+        if environment is None:
+            environment = os.getenv("ENVIRONMENT", "production")
+        if environment.lower() != "cron":
+            log_system_info()
 
         logger.info("Logging system initialized successfully")
         return logger
@@ -68,19 +83,24 @@ def get_logger(name: str) -> logging.Logger:
     return logging.getLogger(name)
 
 
+@functools.lru_cache(maxsize=None)
+def _system_info_lines() -> tuple:
+    """Interpreter and platform details, probed once per process"""
+    return (
+        f"Python version: {sys.version}",
+        f"Platform: {platform.platform()}",
+        f"Architecture: {platform.architecture()}",
+        f"Processor: {platform.processor()}",
+    )
+
+
 def log_system_info():
     """Log system and environment information at startup"""
-    import platform
-    import sys
-    import os
-
     logger = logging.getLogger(__name__)
 
     logger.info("=== SYSTEM INFORMATION ===")
-    logger.info(f"Python version: {sys.version}")
-    logger.info(f"Platform: {platform.platform()}")
-    logger.info(f"Architecture: {platform.architecture()}")
-    logger.info(f"Processor: {platform.processor()}")
+    for line in _system_info_lines():
+        logger.info(line)
     logger.info(f"Working directory: {os.getcwd()}")
     logger.info(f"Script: {' '.join(sys.argv)}")
     logger.info("=== SCRAPER STARTUP ===")
@@ -95,13 +115,12 @@ def log_exception(logger: logging.Logger, exc: Exception, context: str = ""):
         exc: Exception to log
         context: Additional context information
     """
-    import traceback
-
     context_msg = f" in {context}" if context else ""
     logger.error(f"Exception{context_msg}: {type(exc).__name__}: {str(exc)}")
     logger.debug(f"Full traceback:\n{traceback.format_exc()}")
 
 
+@functools.lru_cache(maxsize=None)
 def create_stats_logger() -> logging.Logger:
     """
     Create a dedicated statistics logger
@@ -124,31 +143,23 @@ def create_stats_logger() -> logging.Logger:
 
 
 class ContextLogger:
-    """Context manager that adds context to log messages"""
+    """Context manager that adds context to log messages
+
+    The context is held in a ContextVar, so it applies only to the current
+    thread or asyncio task and leaves handler formatters untouched.
+    """
 
     def __init__(self, logger: logging.Logger, context: str):
         self.logger = logger
         self.context = context
-        self.original_format = None
+        self._token = None
 
     def __enter__(self):
-        # Store original formatter
-        for handler in self.logger.handlers:
-            if hasattr(handler, "formatter") and handler.formatter:
-                self.original_format = handler.formatter._fmt
-                # Add context to format
-                new_format = self.original_format.replace(
-                    "%(message)s", f"[{self.context}] %(message)s"
-                )
-                handler.setFormatter(logging.Formatter(new_format))
+        self._token = LOG_CONTEXT.set(f"[{self.context}] ")
         return self.logger
 
     def __exit__(self, exc_type, exc_val, exc_tb):
-        # Restore original formatter
-        if self.original_format:
-            for handler in self.logger.handlers:
-                if hasattr(handler, "formatter"):
-                    handler.setFormatter(logging.Formatter(self.original_format))
+        LOG_CONTEXT.reset(self._token)
 
 
 class TimedLogger:
@@ -163,16 +174,12 @@ class TimedLogger:
         self.start_time = None
 
     def __enter__(self):
-        import time
-
-        self.start_time = time.time()
+        self.start_time = _perf()
         self.logger.log(self.level, f"Starting {self.operation}")
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
-        import time
-
-        duration = time.time() - self.start_time
+        duration = _perf() - self.start_time
 
         if exc_type is not None:
             self.logger.log(
@@ -184,8 +191,9 @@ class TimedLogger:
             )
 
 
+@functools.lru_cache(maxsize=None)
 def configure_third_party_loggers():
-    """Configure logging levels for third-party libraries"""
+    """Configure logging levels for third-party libraries (once per process)"""
 
     # Reduce noise from common libraries
     library_configs = {
@@ -200,7 +208,3 @@ def configure_third_party_loggers():
 
     for library, level in library_configs.items():
         logging.getLogger(library).setLevel(level)
-
-
-# Initialize third-party logger configuration when module is imported
-configure_third_party_loggers()
@@ -1,16 +1,42 @@
 # Statistics collection and reporting for scraper runs
 
-import json
+import fcntl
 import logging
+import os
+import shutil
+import sys
+import time
+from collections import deque
+from contextlib import contextmanager
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Dict, Any, List, Optional
-from dataclasses import dataclass, asdict
+from typing import Deque, Dict, Any, Iterator, List, Optional, Tuple
+from dataclasses import dataclass, field
+
+import orjson
+
+
+# Counters copied from ScraperStats into RunStats when a run finishes
+RUN_COUNTERS = (
+    "articles_fetched",
+    "articles_processed",
+    "articles_duplicate",
+    "articles_failed",
+    "sources_created",
+    "symbols_created",
+    "industries_created",
+    "sectors_created",
+    "api_calls_made",
+)
 
 
 @dataclass
 class RunStats:
-    """Statistics for a single scraper run"""
+    """Statistics for a single scraper run
+
+    Counters are filled in once, from the owning ``ScraperStats``, when the
+    run is finished; a finished run does not change afterwards.
+    """
 
     run_id: str
     start_time: datetime
@@ -34,11 +60,7 @@ class RunStats:
     api_rate_limit_remaining: int = 0
 
     # Error information
-    errors: List[str] = None
-
-    def __post_init__(self):
-        if self.errors is None:
-            self.errors = []
+    errors: List[str] = field(default_factory=list)
 
     @property
     def duration(self) -> Optional[timedelta]:
@@ -57,21 +79,52 @@ class RunStats:
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for serialization"""
-        data = asdict(self)
+        data = {
+            "run_id": self.run_id,
+            "start_time": self.start_time,
+            "end_time": self.end_time,
+            "success": self.success,
+            "articles_fetched": self.articles_fetched,
+            "articles_processed": self.articles_processed,
+            "articles_duplicate": self.articles_duplicate,
+            "articles_failed": self.articles_failed,
+            "sources_created": self.sources_created,
+            "symbols_created": self.symbols_created,
+            "industries_created": self.industries_created,
+            "sectors_created": self.sectors_created,
+            "api_calls_made": self.api_calls_made,
+            "api_rate_limit_remaining": self.api_rate_limit_remaining,
+            "errors": self.errors,
+        }
         # Convert datetime objects to ISO strings
         if self.start_time:
             data["start_time"] = self.start_time.isoformat()
+            data["start_epoch"] = self.start_time.timestamp()
         if self.end_time:
             data["end_time"] = self.end_time.isoformat()
-        if self.duration:
-            data["duration_seconds"] = self.duration.total_seconds()
+        duration = self.duration
+        if duration:
+            data["duration_seconds"] = duration.total_seconds()
         return data
 
 
+# Runs kept in memory, and lines allowed in the history file before rotation
+HISTORY_SIZE = 100
+ROTATE_LINES = 1000
+
+# Most recent errors kept per run
+MAX_ERRORS = 1000
+
+
 class ScraperStats:
-    """Manages statistics collection and reporting for scraper runs"""
+    """Manages statistics collection and reporting for scraper runs
+
+    History is an append-only newline-delimited JSON file: each finished run
+    appends one line, and the file is rotated to ``.old`` once it grows past
+    ``ROTATE_LINES`` lines.
+    """
 
-    def __init__(self, stats_file: str = "data/scraper_stats.json"):
+    def __init__(self, stats_file: str = "data/scraper_stats.ndjson"):
         """
         Initialize the stats manager
 
@@ -80,6 +133,7 @@ class ScraperStats:
         """
         self.stats_file = Path(stats_file)
         self.logger = logging.getLogger(__name__)
+        self._line_count = 0
 
         # Ensure stats directory exists
         self.stats_file.parent.mkdir(parents=True, exist_ok=True)
@@ -101,27 +155,128 @@ class ScraperStats:
         self.industries_created = 0
         self.sectors_created = 0
         self.api_calls_made = 0
-        self.errors = []
-
-    def _load_historical_stats(self) -> List[Dict[str, Any]]:
-        """Load historical statistics from file"""
+        # (perf_counter_ns, message) pairs, turned into timestamped strings
+        # only when the run is serialized
+        self.errors: Deque[Tuple[int, str]] = deque(maxlen=MAX_ERRORS)
+        self._start_wall = time.time()
+        self._start_perf_ns = time.perf_counter_ns()
+
+    def _load_historical_stats(self) -> Deque[Dict[str, Any]]:
+        """Load the most recent runs from the history file"""
+        history: Deque[Dict[str, Any]] = deque(maxlen=HISTORY_SIZE)
         try:
-            if self.stats_file.exists():
-                with open(self.stats_file, "r") as f:
-                    return json.load(f)
-            return []
-        except (json.JSONDecodeError, OSError) as e:
+            if not self.stats_file.exists():
+                self._migrate_legacy_history()
+            if not self.stats_file.exists():
+                return history
+
+            with open(self.stats_file, "rb") as f:
+                for line in f:
+                    if not line.strip():
+                        continue
+                    self._line_count += 1
+                    try:
+                        history.append(orjson.loads(line))
+                    except orjson.JSONDecodeError:
+                        # Skip a partially written line and keep the rest
+                        continue
+            return history
+
+        except OSError as e:
             self.logger.warning(f"Could not load historical stats: {e}")
-            return []
+            return history
 
-    def _save_historical_stats(self):
-        """Save historical statistics to file"""
+    def _migrate_legacy_history(self):
+        """Convert the JSON array history of older versions to NDJSON"""
+        legacy_file = self.stats_file.with_suffix(".json")
+        if legacy_file == self.stats_file or not legacy_file.exists():
+            return
+
+        tmp_file = self.stats_file.with_name(self.stats_file.name + ".tmp")
         try:
-            with open(self.stats_file, "w") as f:
-                json.dump(self.historical_stats, f, indent=2, default=str)
-        except OSError as e:
+            with self._history_lock():
+                # Another process may have migrated while we waited
+                if self.stats_file.exists():
+                    return
+
+                with open(legacy_file, "rb") as f:
+                    runs = orjson.loads(f.read())
+                with open(tmp_file, "wb") as f:
+                    f.writelines(orjson.dumps(run) + b"\n" for run in runs)
+                os.replace(tmp_file, self.stats_file)
+
+            self.logger.info(
+                f"Migrated {len(runs)} runs from {legacy_file} to {self.stats_file}"
+            )
+        except (orjson.JSONDecodeError, TypeError, OSError) as e:
+            self.logger.warning(f"Could not migrate legacy historical stats: {e}")
+
+    @contextmanager
+    def _history_lock(self) -> Iterator[None]:
+        """Serialize history file updates across scraper processes"""
+        lock_file = self.stats_file.with_name(self.stats_file.name + ".lock")
+        with open(lock_file, "a") as f:
+            fcntl.flock(f, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(f, fcntl.LOCK_UN)
+
+    def _append_historical_stats(self, run_data: Dict[str, Any]):
+        """Append a single run to the history file"""
+        try:
+            line = orjson.dumps(run_data) + b"\n"
+            with self._history_lock(), open(self.stats_file, "ab") as f:
+                f.write(line)
+            self._line_count += 1
+        except (orjson.JSONEncodeError, OSError) as e:
             self.logger.error(f"Could not save historical stats: {e}")
 
+    def maybe_rotate(self):
+        """
+        Rotate the history file once it exceeds ROTATE_LINES lines
+
+        Under the history lock the file is re-read, so runs appended by other
+        processes are kept, and hard-linked to ``.old``. A new file holding
+        the last HISTORY_SIZE runs is written to a temporary path and swapped
+        in with a single ``os.replace``, so the history file always exists
+        and readers never see a partially written one.
+        """
+        if self._line_count <= ROTATE_LINES:
+            return
+
+        old_file = self.stats_file.with_name(self.stats_file.name + ".old")
+        tmp_file = self.stats_file.with_name(self.stats_file.name + ".tmp")
+        try:
+            with self._history_lock():
+                line_count = 0
+                recent: Deque[bytes] = deque(maxlen=HISTORY_SIZE)
+                with open(self.stats_file, "rb") as f:
+                    for line in f:
+                        if line.strip():
+                            line_count += 1
+                            recent.append(
+                                line if line.endswith(b"\n") else line + b"\n"
+                            )
+
+                if line_count > ROTATE_LINES:
+                    # Keep the full file as .old without copying it
+                    tmp_file.unlink(missing_ok=True)
+                    try:
+                        os.link(self.stats_file, tmp_file)
+                    except OSError:
+                        shutil.copyfile(self.stats_file, tmp_file)
+                    os.replace(tmp_file, old_file)
+
+                    with open(tmp_file, "wb") as f:
+                        f.writelines(recent)
+                    os.replace(tmp_file, self.stats_file)
+                    line_count = len(recent)
+
+            self._line_count = line_count
+        except OSError as e:
+            self.logger.warning(f"Could not rotate historical stats: {e}")
+
     def create_run_stats(self, run_id: str = None) -> RunStats:
         """
         Create a RunStats object for the current run
@@ -135,20 +290,7 @@ class ScraperStats:
         if run_id is None:
             run_id = datetime.now().strftime("%Y%m%d_%H%M%S")
 
-        return RunStats(
-            run_id=run_id,
-            start_time=datetime.now(),
-            articles_fetched=self.articles_fetched,
-            articles_processed=self.articles_processed,
-            articles_duplicate=self.articles_duplicate,
-            articles_failed=self.articles_failed,
-            sources_created=self.sources_created,
-            symbols_created=self.symbols_created,
-            industries_created=self.industries_created,
-            sectors_created=self.sectors_created,
-            api_calls_made=self.api_calls_made,
-            errors=self.errors.copy(),
-        )
+        return RunStats(run_id=run_id, start_time=datetime.now())
 
     def finish_run_stats(self, run_stats: RunStats, success: bool):
         """
@@ -161,61 +303,53 @@ class ScraperStats:
         run_stats.end_time = datetime.now()
         run_stats.success = success
 
-        # Update with final values
-        run_stats.articles_fetched = self.articles_fetched
-        run_stats.articles_processed = self.articles_processed
-        run_stats.articles_duplicate = self.articles_duplicate
-        run_stats.articles_failed = self.articles_failed
-        run_stats.sources_created = self.sources_created
-        run_stats.symbols_created = self.symbols_created
-        run_stats.industries_created = self.industries_created
-        run_stats.sectors_created = self.sectors_created
-        run_stats.api_calls_made = self.api_calls_made
-        run_stats.errors = self.errors.copy()
-
-        # Add to historical stats
-        self.historical_stats.append(run_stats.to_dict())
+        # Snapshot the final values, so later resets leave this run alone
+        for name in RUN_COUNTERS:
+            setattr(run_stats, name, getattr(self, name))
+        run_stats.errors = self.formatted_errors()
 
-        # Keep only last 100 runs to prevent file from growing too large
-        if len(self.historical_stats) > 100:
-            self.historical_stats = self.historical_stats[-100:]
-
-        self._save_historical_stats()
+        # Add to historical stats; the deque keeps only the last HISTORY_SIZE
+        run_data = run_stats.to_dict()
+        self.historical_stats.append(run_data)
+        self._append_historical_stats(run_data)
+        self.maybe_rotate()
 
         # Log comprehensive statistics
         self._log_run_summary(run_stats)
 
+    def formatted_errors(self) -> List[str]:
+        """Current run errors as "<ISO timestamp>: <message>" strings"""
+        formatted = []
+        for ns, message in self.errors:
+            wall = self._start_wall + (ns - self._start_perf_ns) / 1e9
+            formatted.append(f"{datetime.fromtimestamp(wall).isoformat()}: {message}")
+        return formatted
+
     def add_error(self, error: str):
         """Add an error to the current run statistics"""
-        self.errors.append(f"{datetime.now().isoformat()}: {error}")
+        self.errors.append((time.perf_counter_ns(), error))
         self.logger.error(error)
 
     def _log_run_summary(self, run_stats: RunStats):
-        """Log a comprehensive summary of the run"""
-        self.logger.info("=== RUN SUMMARY ===")
-        self.logger.info(f"Run ID: {run_stats.run_id}")
-        self.logger.info(f"Success: {run_stats.success}")
-        self.logger.info(f"Duration: {run_stats.duration}")
-
-        self.logger.info("Articles:")
-        self.logger.info(f"  Fetched: {run_stats.articles_fetched}")
-        self.logger.info(f"  Processed: {run_stats.articles_processed}")
-        self.logger.info(f"  Duplicates: {run_stats.articles_duplicate}")
-        self.logger.info(f"  Failed: {run_stats.articles_failed}")
-        self.logger.info(f"  Success Rate: {run_stats.success_rate:.1f}%")
-
-        self.logger.info("Entities Created:")
-        self.logger.info(f"  Sources: {run_stats.sources_created}")
-        self.logger.info(f"  Symbols: {run_stats.symbols_created}")
-        self.logger.info(f"  Industries: {run_stats.industries_created}")
-        self.logger.info(f"  Sectors: {run_stats.sectors_created}")
-
-        self.logger.info(f"API Calls: {run_stats.api_calls_made}")
-
-        if run_stats.errors:
-            self.logger.info(f"Errors: {len(run_stats.errors)}")
-            for error in run_stats.errors[-5:]:  # Show last 5 errors
-                self.logger.info(f"  {error}")
+        """
+        Log a summary of the run as a single structured record
+
+        The message is ``run_summary`` followed by a JSON object, and the
+        same fields are attached to the record as ``record.run_summary``.
+        """
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
+
+        summary = run_stats.to_dict()
+        summary["success_rate"] = round(run_stats.success_rate, 1)
+        summary["error_count"] = len(summary["errors"])
+        summary["errors"] = summary["errors"][-5:]  # Show last 5 errors
+
+        self.logger.info(
+            "run_summary %s",
+            orjson.dumps(summary).decode(),
+            extra={"run_summary": summary},
+        )
 
     def get_recent_stats(self, days: int = 7) -> List[Dict[str, Any]]:
         """
@@ -227,16 +361,21 @@ class ScraperStats:
         Returns:
             List[Dict]: Recent run statistics
         """
-        cutoff_date = datetime.now() - timedelta(days=days)
+        cutoff = (datetime.now() - timedelta(days=days)).timestamp()
         recent_stats = []
 
         for stats in self.historical_stats:
-            try:
-                start_time = datetime.fromisoformat(stats["start_time"])
-                if start_time >= cutoff_date:
-                    recent_stats.append(stats)
-            except (KeyError, ValueError):
-                continue
+            start_epoch = stats.get("start_epoch")
+            if start_epoch is None:
+                # Runs recorded before start_epoch was stored
+                try:
+                    start_time = datetime.fromisoformat(stats["start_time"])
+                    start_epoch = start_time.timestamp()
+                except (KeyError, ValueError):
+                    continue
+
+            if start_epoch >= cutoff:
+                recent_stats.append(stats)
 
         return recent_stats
 
@@ -264,14 +403,14 @@ class ScraperStats:
                 "total_errors": 0,
             }
 
-        successful_runs = sum(
-            1 for stats in recent_stats if stats.get("success", False)
-        )
-        total_articles = sum(
-            stats.get("articles_processed", 0) for stats in recent_stats
-        )
-        total_api_calls = sum(stats.get("api_calls_made", 0) for stats in recent_stats)
-        total_errors = sum(len(stats.get("errors", [])) for stats in recent_stats)
+        # Accumulate every total in a single pass over the runs
+        successful_runs = total_articles = total_api_calls = total_errors = 0
+        for stats in recent_stats:
+            if stats.get("success", False):
+                successful_runs += 1
+            total_articles += stats.get("articles_processed", 0)
+            total_api_calls += stats.get("api_calls_made", 0)
+            total_errors += len(stats.get("errors", ()))
 
         return {
             "period_days": days,
@@ -297,16 +436,22 @@ class ScraperStats:
         """
         summary = self.get_summary_stats(days)
 
-        print(f"\n=== SCRAPER PERFORMANCE REPORT ({days} days) ===")
-        print(f"Total Runs: {summary['total_runs']}")
-        print(f"Successful Runs: {summary['successful_runs']}")
-        print(f"Success Rate: {summary['success_rate']:.1f}%")
-        print(f"Total Articles Processed: {summary['total_articles_processed']}")
-        print(f"Average Articles per Run: {summary['average_articles_per_run']:.1f}")
-        print(f"Total API Calls: {summary['total_api_calls']}")
-        print(f"Total Errors: {summary['total_errors']}")
-
-        if summary["first_run"]:
-            print(f"Period: {summary['first_run']} to {summary['last_run']}")
-
-        print("=" * 50)
+        lines = [
+            f"\n=== SCRAPER PERFORMANCE REPORT ({days} days) ===",
+            f"Total Runs: {summary['total_runs']}",
+            f"Successful Runs: {summary['successful_runs']}",
+            f"Success Rate: {summary['success_rate']:.1f}%",
+            f"Total Articles Processed: {summary['total_articles_processed']}",
+            f"Average Articles per Run: {summary['average_articles_per_run']:.1f}",
+            f"Total API Calls: {summary['total_api_calls']}",
+            f"Total Errors: {summary['total_errors']}",
+        ]
+
+        if summary.get("first_run"):
+            lines.append(f"Period: {summary['first_run']} to {summary['last_run']}")
+
+        lines.append("=" * 50)
+
+        # One write and flush instead of a locked write per line
+        sys.stdout.write("\n".join(lines) + "\n")
+        sys.stdout.flush()